@@ -2,9 +2,23 @@
 """Fetch base16 color schemes and convert to Textual themes."""
 
 import json
+import time
+import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+# Concurrent downloads; fetching is latency bound, not bandwidth bound
+MAX_WORKERS = 32
+
+# Retries for transient failures: 5xx, 429 rate limits, dropped
+# connections and timeouts
+MAX_RETRIES = 3
+
+# Seconds before a stalled request gives up (and is retried)
+REQUEST_TIMEOUT = 30
+
 
 # Base16 to Textual mapping:
 # base00: darkest background -> background
@@ -28,15 +42,33 @@ def fetch_scheme_list():
     """Fetch list of available base16 schemes with download URLs."""
     url = "https://api.github.com/repos/tinted-theming/schemes/contents/base16"
     req = urllib.request.Request(url, headers={"Accept": "application/vnd.github.v3+json"})
-    with urllib.request.urlopen(req) as resp:
+    with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as resp:
         return json.load(resp)
 
 
+@lru_cache(maxsize=None)
 def fetch_scheme(download_url: str) -> dict:
-    """Fetch a single scheme YAML and parse it."""
+    """Fetch a single scheme YAML and parse it, retrying transient failures.
+
+    The response is handed straight to the YAML loader, which decodes UTF-8
+    itself. Parsed schemes are memoized per URL.
+    """
     import yaml
-    with urllib.request.urlopen(download_url) as resp:
-        return yaml.safe_load(resp.read().decode())
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # libyaml not available
+        from yaml import SafeLoader
+    for attempt in range(MAX_RETRIES):
+        try:
+            with urllib.request.urlopen(download_url, timeout=REQUEST_TIMEOUT) as resp:
+                return yaml.load(resp, Loader=SafeLoader)
+        except urllib.error.HTTPError as e:
+            if (e.code != 429 and e.code < 500) or attempt == MAX_RETRIES - 1:
+                raise
+        except (urllib.error.URLError, TimeoutError):
+            if attempt == MAX_RETRIES - 1:
+                raise
+        time.sleep(0.5 * (attempt + 1))
 
 
 def base16_to_textual(scheme: dict) -> dict:
@@ -58,40 +90,40 @@ def base16_to_textual(scheme: dict) -> dict:
     }
 
 
+HEADER = '''"""Auto-generated themes from base16 color schemes."""
+
+from textual.theme import Theme
+
+BASE16_THEMES = [
+'''
+
+THEME_TEMPLATE = '''    Theme(
+        name="{name}",
+        primary="{primary}",
+        secondary="{secondary}",
+        accent="{accent}",
+        background="{background}",
+        surface="{surface}",
+        warning="{warning}",
+        error="{error}",
+        success="{success}",
+        dark={dark},
+    ),
+'''
+
+FOOTER = ''']
+
+
+def register_base16_themes(app):
+    """Register all base16 themes with a Textual app."""
+    for theme in BASE16_THEMES:
+        app.register_theme(theme)
+'''
+
+
 def generate_python_themes(themes: list[dict]) -> str:
     """Generate Python code for Textual themes."""
-    lines = [
-        '"""Auto-generated themes from base16 color schemes."""',
-        "",
-        "from textual.theme import Theme",
-        "",
-        "BASE16_THEMES = [",
-    ]
-
-    for t in themes:
-        lines.append(f"    Theme(")
-        lines.append(f'        name="{t["name"]}",')
-        lines.append(f'        primary="{t["primary"]}",')
-        lines.append(f'        secondary="{t["secondary"]}",')
-        lines.append(f'        accent="{t["accent"]}",')
-        lines.append(f'        background="{t["background"]}",')
-        lines.append(f'        surface="{t["surface"]}",')
-        lines.append(f'        warning="{t["warning"]}",')
-        lines.append(f'        error="{t["error"]}",')
-        lines.append(f'        success="{t["success"]}",')
-        lines.append(f'        dark={t["dark"]},')
-        lines.append(f"    ),")
-
-    lines.append("]")
-    lines.append("")
-    lines.append("")
-    lines.append("def register_base16_themes(app):")
-    lines.append('    """Register all base16 themes with a Textual app."""')
-    lines.append("    for theme in BASE16_THEMES:")
-    lines.append("        app.register_theme(theme)")
-    lines.append("")
-
-    return "\n".join(lines)
+    return HEADER + "".join(THEME_TEMPLATE.format_map(t) for t in themes) + FOOTER
 
 
 def main():
@@ -103,15 +135,23 @@ def main():
 
     print(f"Found {len(yaml_files)} schemes, fetching...")
 
-    themes = []
-    for i, (name, url) in enumerate(yaml_files):
-        try:
-            scheme = fetch_scheme(url)
-            theme = base16_to_textual(scheme)
-            themes.append(theme)
-            print(f"  [{i+1}/{len(yaml_files)}] {theme['display_name']}")
-        except Exception as e:
-            print(f"  [{i+1}/{len(yaml_files)}] SKIP {name}: {e}")
+    # Fetch concurrently, but keep the original listing order in the output
+    results: dict[int, dict] = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        futures = {
+            ex.submit(fetch_scheme, url): (i, name)
+            for i, (name, url) in enumerate(yaml_files)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            i, name = futures[future]
+            try:
+                theme = base16_to_textual(future.result())
+                results[i] = theme
+                print(f"  [{done}/{len(yaml_files)}] {theme['display_name']}")
+            except Exception as e:
+                print(f"  [{done}/{len(yaml_files)}] SKIP {name}: {e}")
+
+    themes = [results[i] for i in sorted(results)]
 
     print(f"\nConverted {len(themes)} themes")
 
@@ -1,9 +1,28 @@
 """Shared configuration management for cat_* apps."""
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
+# Parsed config files keyed by path: (st_mtime_ns, config)
+_CONFIG_CACHE: dict[Path, tuple[int, dict]] = {}
+
+
+@lru_cache(maxsize=None)
+def _yaml():
+    """Import yaml on first use, preferring the libyaml loader/dumper.
+
+    Returns:
+        Tuple of (yaml module, SafeLoader, SafeDumper).
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+    except ImportError:  # libyaml not available
+        from yaml import SafeDumper, SafeLoader
+    return yaml, SafeLoader, SafeDumper
 
 
 def get_config_dir(app_name: str = "loopcat") -> Path:
@@ -55,17 +74,31 @@ def get_config_path(app_name: str = "loopcat") -> Path:
 def load_config(config_path: Path) -> dict:
     """Load configuration from YAML file.
 
+    Parsed results are cached per path and reused until the file's mtime
+    changes. Callers get a deep copy, so the result may be mutated freely
+    before handing it back to save_config.
+
     Args:
         config_path: Path to the config file.
 
     Returns:
         Configuration dictionary (empty if file doesn't exist).
     """
-    if not config_path.exists():
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _CONFIG_CACHE.pop(config_path, None)
         return {}
 
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return copy.deepcopy(cached[1])
+
+    yaml, SafeLoader, _ = _yaml()
     with open(config_path) as f:
-        return yaml.safe_load(f) or {}
+        config = yaml.load(f, Loader=SafeLoader) or {}
+    _CONFIG_CACHE[config_path] = (mtime, config)
+    return copy.deepcopy(config)
 
 
 def save_config(config: dict, config_path: Path) -> None:
@@ -77,8 +110,12 @@ def save_config(config: dict, config_path: Path) -> None:
     """
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
+    yaml, _, SafeDumper = _yaml()
     with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False)
+        yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False)
+
+    # Prime the cache so the next load_config is a hit
+    _CONFIG_CACHE[config_path] = (config_path.stat().st_mtime_ns, copy.deepcopy(config))
 
 
 # Default theme for all cat_* apps
@@ -1,9 +1,13 @@
 """Shared theme management for cat_* apps."""
 
+from functools import partial
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import VerticalScroll
 from textual.screen import ModalScreen
+from textual.theme import BUILTIN_THEMES as TEXTUAL_THEMES
+from textual.timer import Timer
 from textual.widgets import Input, OptionList, Static
 from textual.widgets.option_list import Option
 
@@ -34,6 +38,78 @@ BUILTIN_THEMES = [
 _builtin_set = set(BUILTIN_THEMES)
 THEMES = BUILTIN_THEMES + [t.name for t in BASE16_THEMES if t.name not in _builtin_set]
 
+# Seconds the highlight must rest on a theme before it is previewed app-wide
+PREVIEW_DELAY = 0.1
+
+# Theme name -> Theme, for rendering palette swatches without applying the theme
+_THEME_OBJECTS = {**TEXTUAL_THEMES, **{t.name: t for t in BASE16_THEMES}}
+
+# Theme name -> position in THEMES
+_THEME_INDEX = {name: i for i, name in enumerate(THEMES)}
+
+# Lowercased names, computed once rather than on every keystroke
+_THEMES_LOWER = [t.lower() for t in THEMES]
+
+
+def _build_bigram_index(themes_lower: list[str]) -> dict[str, set[int]]:
+    """Map each character bigram to the indices of the names containing it."""
+    index: dict[str, set[int]] = {}
+    for i, low in enumerate(themes_lower):
+        for j in range(len(low) - 1):
+            index.setdefault(low[j:j + 2], set()).add(i)
+    return index
+
+
+# Bigram -> indices of themes whose lowercased name contains it
+_THEME_BIGRAMS = _build_bigram_index(_THEMES_LOWER)
+
+# One Option per theme, reused across filter changes instead of rebuilt per keystroke
+_OPTION_CACHE = {t: Option(t, id=t) for t in THEMES}
+
+
+def _filter_themes(text: str) -> list[str]:
+    """Return themes whose name contains text (case-insensitive), in THEMES order.
+
+    Queries of two or more characters are narrowed with the bigram index
+    before the substring check.
+
+    Args:
+        text: Lowercased filter text.
+
+    Returns:
+        Matching theme names.
+    """
+    if not text:
+        return list(THEMES)
+    if len(text) == 1:
+        return [t for t, low in zip(THEMES, _THEMES_LOWER) if text in low]
+
+    candidates = None
+    for j in range(len(text) - 1):
+        indices = _THEME_BIGRAMS.get(text[j:j + 2])
+        if not indices:
+            return []
+        candidates = indices if candidates is None else candidates & indices
+        if not candidates:
+            return []
+    return [THEMES[i] for i in sorted(candidates) if text in _THEMES_LOWER[i]]
+
+
+def _render_swatch(name: str) -> str:
+    """Render colored blocks for a theme's primary/secondary/accent/surface.
+
+    Args:
+        name: Theme name.
+
+    Returns:
+        Markup for the swatch (empty if the theme's palette is unknown).
+    """
+    theme = _THEME_OBJECTS.get(name)
+    if theme is None:
+        return ""
+    colors = (theme.primary, theme.secondary, theme.accent, theme.surface)
+    return " ".join(f"[on {c}]      [/]" for c in colors if c)
+
 
 class ThemePickerScreen(ModalScreen[str | None]):
     """Modal screen for selecting a theme with search and live preview."""
@@ -56,6 +132,13 @@ class ThemePickerScreen(ModalScreen[str | None]):
         margin-bottom: 1;
     }
 
+    #theme-swatch {
+        dock: top;
+        height: 1;
+        margin-bottom: 1;
+        text-align: center;
+    }
+
     #theme-list {
         height: 1fr;
     }
@@ -83,11 +166,13 @@ class ThemePickerScreen(ModalScreen[str | None]):
         super().__init__()
         self.current_theme = current_theme
         self.filter_text = ""
+        self._preview_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         with VerticalScroll(id="theme-dialog"):
             yield Input(placeholder="Type to filter themes...", id="theme-search")
-            yield OptionList(*[Option(t, id=t) for t in THEMES], id="theme-list")
+            yield Static(_render_swatch(self.current_theme), id="theme-swatch")
+            yield OptionList(*_OPTION_CACHE.values(), id="theme-list")
             yield Static("[dim]enter[/] select  [dim]esc[/] cancel", id="theme-hint")
 
     def on_mount(self) -> None:
@@ -98,26 +183,44 @@ class ThemePickerScreen(ModalScreen[str | None]):
         """Set initial focus and selection after widgets are ready."""
         self.query_one("#theme-search", Input).focus()
         option_list = self.query_one("#theme-list", OptionList)
-        try:
-            idx = THEMES.index(self.current_theme)
+        idx = _THEME_INDEX.get(self.current_theme)
+        if idx is not None:
             option_list.highlighted = idx
-        except ValueError:
-            pass
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Filter themes as user types."""
         self.filter_text = event.value.lower()
         option_list = self.query_one("#theme-list", OptionList)
+        filtered = _filter_themes(self.filter_text)
         option_list.clear_options()
-        filtered = [t for t in THEMES if self.filter_text in t.lower()]
-        option_list.add_options([Option(t, id=t) for t in filtered])
         if filtered:
+            option_list.add_options([_OPTION_CACHE[t] for t in filtered])
             option_list.highlighted = 0
 
     def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
-        """Preview theme as user navigates."""
+        """Preview theme as user navigates.
+
+        The palette swatch updates immediately. Re-theming restyles the whole
+        app, so that preview is debounced: a burst of cursor moves only applies
+        the theme the highlight settles on.
+        """
         if event.option:
-            self.app.theme = event.option.id
+            self.query_one("#theme-swatch", Static).update(_render_swatch(event.option.id))
+            self._cancel_preview()
+            self._preview_timer = self.set_timer(
+                PREVIEW_DELAY, partial(self._apply_preview, event.option.id)
+            )
+
+    def _apply_preview(self, theme: str) -> None:
+        """Apply a highlighted theme to the app."""
+        self._preview_timer = None
+        self.app.theme = theme
+
+    def _cancel_preview(self) -> None:
+        """Drop any pending theme preview."""
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+            self._preview_timer = None
 
     def _move_highlight(self, delta: int) -> None:
         """Move the option list highlight by delta."""
@@ -127,8 +230,10 @@ class ThemePickerScreen(ModalScreen[str | None]):
         if option_list.highlighted is None:
             option_list.highlighted = 0
         else:
-            new_idx = option_list.highlighted + delta
-            option_list.highlighted = max(0, min(new_idx, option_list.option_count - 1))
+            new_idx = max(0, min(option_list.highlighted + delta, option_list.option_count - 1))
+            # Holding an arrow at either end of the list is a no-op
+            if new_idx != option_list.highlighted:
+                option_list.highlighted = new_idx
 
     def action_cursor_down(self) -> None:
         """Move cursor down in the option list."""
@@ -148,11 +253,13 @@ class ThemePickerScreen(ModalScreen[str | None]):
 
     def action_cancel(self) -> None:
         """Cancel and restore original theme."""
+        self._cancel_preview()
         self.app.theme = self.current_theme
         self.dismiss(None)
 
     def action_select(self) -> None:
         """Select the highlighted theme."""
+        self._cancel_preview()
         option_list = self.query_one("#theme-list", OptionList)
         if option_list.highlighted is not None and option_list.option_count > 0:
             option = option_list.get_option_at_index(option_list.highlighted)
@@ -163,6 +270,7 @@ class ThemePickerScreen(ModalScreen[str | None]):
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle double-click/enter on option."""
+        self._cancel_preview()
         if event.option:
             self.dismiss(event.option.id)
 
@@ -45,14 +45,8 @@ connect to in your DAW or other MIDI software.
 
     # Import and run the TUI
     from fadercat.tui import FadercatApp
-    from fadercat.midi import DEFAULT_PORT_NAME
 
-    # Update default port name if specified
-    if args.port != DEFAULT_PORT_NAME:
-        import fadercat.midi
-        fadercat.midi.DEFAULT_PORT_NAME = args.port
-
-    app = FadercatApp()
+    app = FadercatApp(port_name=args.port)
     app.run()
 
 
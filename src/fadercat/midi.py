@@ -1,6 +1,6 @@
 """MIDI engine for fadercat - focused on CC messages."""
 
-from typing import Optional
+from typing import Iterable, Optional
 
 import mido
 
@@ -11,12 +11,20 @@ DEFAULT_PORT_NAME = "Fadercat"
 class MidiEngine:
     """MIDI output engine for sending control change messages."""
 
-    def __init__(self) -> None:
-        """Initialize the MIDI engine."""
+    def __init__(self, virtual_port_name: str = DEFAULT_PORT_NAME) -> None:
+        """Initialize the MIDI engine.
+
+        Args:
+            virtual_port_name: Name used by open_virtual() when none is given.
+        """
+        self.virtual_port_name = virtual_port_name
         self.output: Optional[mido.ports.BaseOutput] = None
         self.channel: int = 0  # 0-15 (displayed as 1-16)
         self.port_name: str = ""
         self.is_virtual: bool = False
+        # Reusable control_change messages keyed by CC number. Ports
+        # serialize on send, so mutating a message after sending is safe.
+        self._cc_msg_pool: dict[int, mido.Message] = {}
 
     def list_outputs(self) -> list[str]:
         """Get list of available MIDI output ports.
@@ -26,17 +34,19 @@ class MidiEngine:
         """
         return mido.get_output_names()
 
-    def open_virtual(self, port_name: str = DEFAULT_PORT_NAME) -> bool:
+    def open_virtual(self, port_name: Optional[str] = None) -> bool:
         """Open a virtual MIDI output port.
 
         Creates a virtual port that other applications can connect to.
 
         Args:
-            port_name: Name for the virtual port.
+            port_name: Name for the virtual port. Defaults to virtual_port_name.
 
         Returns:
             True if port opened successfully, False otherwise.
         """
+        if port_name is None:
+            port_name = self.virtual_port_name
         try:
             if self.output:
                 self.output.close()
@@ -85,7 +95,29 @@ class MidiEngine:
         Args:
             channel: MIDI channel (0-15, displayed as 1-16).
         """
-        self.channel = max(0, min(15, channel))
+        if not 0 <= channel <= 0x0F:
+            channel = 0 if channel < 0 else 0x0F
+        self.channel = channel
+
+    def _cc_message(self, cc_number: int, value: int) -> mido.Message:
+        """Return the pooled control_change message set to cc_number/value.
+
+        Args:
+            cc_number: CC number, clamped to 0-127.
+            value: CC value, clamped to 0-127.
+        """
+        # Clamp to the 7-bit range; in-range values skip the clamp
+        if not 0 <= cc_number <= 0x7F:
+            cc_number = 0 if cc_number < 0 else 0x7F
+        if not 0 <= value <= 0x7F:
+            value = 0 if value < 0 else 0x7F
+        msg = self._cc_msg_pool.get(cc_number)
+        if msg is None:
+            msg = mido.Message("control_change", control=cc_number)
+            self._cc_msg_pool[cc_number] = msg
+        msg.value = value
+        msg.channel = self.channel
+        return msg
 
     def cc(self, cc_number: int, value: int) -> None:
         """Send a control change message.
@@ -95,16 +127,19 @@ class MidiEngine:
             value: CC value (0-127).
         """
         if self.output:
-            # Clamp values to valid range
-            cc_number = max(0, min(127, cc_number))
-            value = max(0, min(127, value))
-            msg = mido.Message(
-                "control_change",
-                control=cc_number,
-                value=value,
-                channel=self.channel,
-            )
-            self.output.send(msg)
+            self.output.send(self._cc_message(cc_number, value))
+
+    def cc_batch(self, pairs: Iterable[tuple[int, int]]) -> None:
+        """Send several control change messages in one pass.
+
+        Args:
+            pairs: (cc_number, value) pairs to send, in order.
+        """
+        if self.output:
+            send = self.output.send
+            make = self._cc_message
+            for cc_number, value in pairs:
+                send(make(cc_number, value))
 
     def note_on(self, note: int, velocity: int = 100) -> None:
         """Send a note on message.
@@ -1,5 +1,7 @@
 """TUI interface for fadercat - a MIDI fader controller."""
 
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 from textual.app import App, ComposeResult
@@ -45,11 +47,109 @@ STEP_NORMAL = 4
 STEP_FINE = 1
 STEP_COARSE = 16
 
+# Seconds between MIDI/side-panel flushes while faders are being adjusted
+FLUSH_INTERVAL = 1 / 60
+
 # Display modes
 MODE_VERTICAL = "vertical"
 MODE_HORIZONTAL = "horizontal"
 
 
+# Bar rows for the fader and side panel visualizations
+BAR_ROW_EMPTY = "[dim]░░░[/]"
+BAR_ROW_FULL = "[bold]█▓█[/]"
+LARGE_BAR_ROW_EMPTY = "[dim]░░░░░░░░░░░░░░░░░░[/]"
+LARGE_BAR_ROW_FULL = "[bold]█▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓█[/]"
+
+
+def _filled(value: int, size: int) -> int:
+    """Number of bar cells lit for a 0-127 value over size cells."""
+    return (value * size) // 127
+
+
+@lru_cache(maxsize=512)
+def _render_vertical_bar(height: int, filled: int, empty_row: str, full_row: str) -> str:
+    """Render a vertical bar of height rows, the bottom filled rows lit."""
+    return "\n".join([empty_row] * (height - filled) + [full_row] * filled)
+
+
+@lru_cache(maxsize=512)
+def _render_horizontal_bar(width: int, filled: int) -> str:
+    """Render a horizontal bar of width cells, the leftmost filled cells lit."""
+    filled_chars = "█" * filled
+    empty_chars = "░" * (width - filled)
+    return f"[bold]{filled_chars}[/][dim]{empty_chars}[/]"
+
+
+# Number keys 1-8 select a fader directly
+SELECT_KEYS = {str(i + 1): i for i in range(8)}
+
+# Mode-specific navigation: key -> (action, direction)
+# Vertical: h/l = select, j/k = adjust
+# Horizontal: j/k = select, h/l = adjust
+NAV_KEYS = {
+    MODE_VERTICAL: {
+        "h": ("select", -1),
+        "l": ("select", 1),
+        "j": ("adjust", -1),
+        "k": ("adjust", 1),
+    },
+    MODE_HORIZONTAL: {
+        "k": ("select", -1),
+        "j": ("select", 1),
+        "h": ("adjust", -1),
+        "l": ("adjust", 1),
+    },
+}
+
+
+def _build_key_map(nav: dict[str, tuple[str, int]]) -> dict[str, tuple[str, int]]:
+    """Expand a mode's navigation keys into a map of every accepted key name.
+
+    Shift+letter comes through as an uppercase letter, not "shift+letter",
+    and selects the fine step; ctrl selects the coarse step. Values are
+    ("choose", index), ("select", direction) or ("adjust", delta).
+    """
+    key_map: dict[str, tuple[str, int]] = {}
+    for key, index in SELECT_KEYS.items():
+        key_map[key] = key_map[f"ctrl+{key}"] = ("choose", index)
+    for key, (action, direction) in nav.items():
+        if action == "select":
+            variants = dict.fromkeys(
+                (key, key.upper(), f"ctrl+{key}", f"ctrl+{key.upper()}"), direction
+            )
+        else:
+            variants = {
+                key: direction * STEP_NORMAL,
+                key.upper(): direction * STEP_FINE,
+                f"ctrl+{key}": direction * STEP_COARSE,
+                f"ctrl+{key.upper()}": direction * STEP_FINE,
+            }
+        for name, amount in variants.items():
+            key_map[name] = (action, amount)
+    return key_map
+
+
+# Display mode -> key name -> action, built once so on_key is a single lookup
+KEY_MAPS = {mode: _build_key_map(nav) for mode, nav in NAV_KEYS.items()}
+
+
+# Picker options are immutable, so they are built once and shared
+CHANNEL_OPTIONS = [Option(f"Channel {i+1}", id=str(i)) for i in range(16)]
+
+
+@lru_cache(maxsize=64)
+def _output_option(port_name: str) -> Option:
+    """Option for an existing MIDI output port."""
+    return Option(port_name, id=port_name)
+
+
+@lru_cache(maxsize=8)
+def _virtual_option(port_name: str) -> Option:
+    """Option for creating a virtual port with the given name."""
+    return Option(f"{OutputPickerScreen.VIRTUAL_PORT_PREFIX}{port_name}", id="__virtual__")
+
+
 def get_display_mode(config_path) -> str:
     """Load display mode from config, default to vertical."""
     config = load_config(config_path)
@@ -128,11 +228,19 @@ class FaderWidget(Static):
         self.key_up = key_up
         self.key_down = key_down
         self._bar_height = 10  # Default, will be updated on resize
+        # Last drawn (height, filled) bar and value, to skip unchanged redraws
+        self._last_bar: Optional[tuple[int, int]] = None
+        self._last_value: Optional[int] = None
+        # Child widgets, kept from compose so updates skip DOM queries
+        self._bar_widget: Optional[Static] = None
+        self._value_widget: Optional[Static] = None
 
     def compose(self) -> ComposeResult:
+        self._bar_widget = Static("", classes="fader-bar", id=f"bar-{self.fader_index}")
+        self._value_widget = Static("0", classes="fader-value", id=f"value-{self.fader_index}")
         yield Static(f"{self.fader_index + 1}", classes="fader-index")
-        yield Static("", classes="fader-bar", id=f"bar-{self.fader_index}")
-        yield Static("0", classes="fader-value", id=f"value-{self.fader_index}")
+        yield self._bar_widget
+        yield self._value_widget
 
     def on_mount(self) -> None:
         """Update display on mount."""
@@ -140,13 +248,12 @@ class FaderWidget(Static):
 
     def on_resize(self, event) -> None:
         """Handle resize to adjust bar height."""
-        try:
-            bar = self.query_one(f"#bar-{self.fader_index}", Static)
-            # Get the bar's content height (available space for the bar)
-            self._bar_height = max(1, bar.size.height)
-            self._update_display()
-        except Exception:
-            pass
+        # The bar fills everything but the index and value rows
+        height = max(1, event.size.height - 2)
+        if height == self._bar_height:
+            return
+        self._bar_height = height
+        self._update_display()
 
     def watch_value(self, value: int) -> None:
         """React to value changes."""
@@ -161,37 +268,31 @@ class FaderWidget(Static):
 
     def _update_display(self) -> None:
         """Update the bar and value display."""
-        try:
-            bar = self.query_one(f"#bar-{self.fader_index}", Static)
-            value_display = self.query_one(f"#value-{self.fader_index}", Static)
+        bar = self._bar_widget
+        if bar is None:
+            return
 
-            # Update bar height from actual widget size
-            if bar.size.height > 0:
-                self._bar_height = bar.size.height
+        # Update bar height from actual widget size
+        if bar.size.height > 0:
+            self._bar_height = bar.size.height
 
-            # Create visual bar
-            bar_content = self._render_bar()
-            bar.update(bar_content)
+        # Only redraw the bar when its quantized fill (or height) changed
+        bar_state = (self._bar_height, _filled(self.value, self._bar_height))
+        if bar_state != self._last_bar:
+            bar.update(self._render_bar())
+            self._last_bar = bar_state
 
-            # Update value
-            value_display.update(str(self.value))
-        except Exception:
-            pass
+        # Update value
+        if self.value != self._last_value:
+            self._value_widget.update(str(self.value))
+            self._last_value = self.value
 
     def _render_bar(self) -> str:
         """Render the fader bar visualization filling available height."""
         height = self._bar_height
-        # Calculate filled rows (fine-grained: each row represents ~1 MIDI value)
-        filled = int((self.value / 127) * height)
-        empty = height - filled
-
-        lines = []
-        for _ in range(empty):
-            lines.append("[dim]░░░[/]")
-        for _ in range(filled):
-            lines.append("[bold]█▓█[/]")
-
-        return "\n".join(lines)
+        return _render_vertical_bar(
+            height, _filled(self.value, height), BAR_ROW_EMPTY, BAR_ROW_FULL
+        )
 
 
 class HorizontalFaderWidget(Static):
@@ -224,6 +325,13 @@ class HorizontalFaderWidget(Static):
         self.cc_number = cc_number
         self.label = label
         self._bar_width = 30  # Default, updated on resize
+        self._last_row: Optional[str] = None
+        self._bar_str: Optional[str] = None
+        # Row text around the value and bar never changes; format it once
+        cc_str = f"CC{cc_number:<2}"
+        label_str = f"{label[:8]:<8}"
+        self._row_selected = (f"[bold]{cc_str}[/]  ", f" [bold]{label_str}[/]")
+        self._row_unselected = (f"[dim]{cc_str}[/]  ", f" {label_str}")
 
     def on_mount(self) -> None:
         self._update_display()
@@ -233,7 +341,10 @@ class HorizontalFaderWidget(Static):
         # Format: "CC##  val ████░░░░ Label   "
         # Fixed parts: CC label (4) + spaces (2) + value (3) + space (1) + label (8) + space (1) = 19
         available = self.size.width - 19
-        self._bar_width = max(10, available)
+        width = max(10, available)
+        if width == self._bar_width:
+            return
+        self._bar_width = width
         self._update_display()
 
     def watch_value(self, value: int) -> None:
@@ -244,35 +355,25 @@ class HorizontalFaderWidget(Static):
             self.add_class("selected")
         else:
             self.remove_class("selected")
-        self._update_display()
-
-    def _update_display(self) -> None:
-        content = self._render_row()
-        self.update(content)
-
-    def _render_row(self) -> str:
+        # Only the label styling changes; the bar can be reused as is
+        self._update_display(reuse_bar=True)
+
+    def _update_display(self, reuse_bar: bool = False) -> None:
+        if not reuse_bar or self._bar_str is None:
+            self._bar_str = self._render_bar()
+        content = self._render_row(self._bar_str)
+        if content != self._last_row:
+            self.update(content)
+            self._last_row = content
+
+    def _render_row(self, bar: str) -> str:
         # Format: CC##  val ████░░░░ Label
-        cc_str = f"CC{self.cc_number:<2}"
-        val_str = f"{self.value:>3}"
-        label_str = f"{self.label[:8]:<8}"
-
-        # Render horizontal bar
-        bar = self._render_bar()
-
-        if self.selected:
-            return f"[bold]{cc_str}[/]  {val_str} {bar} [bold]{label_str}[/]"
-        else:
-            return f"[dim]{cc_str}[/]  {val_str} {bar} {label_str}"
+        prefix, suffix = self._row_selected if self.selected else self._row_unselected
+        return f"{prefix}{self.value:>3} {bar}{suffix}"
 
     def _render_bar(self) -> str:
         width = self._bar_width
-        filled = int((self.value / 127) * width)
-        empty = width - filled
-
-        filled_chars = "█" * filled
-        empty_chars = "░" * empty
-
-        return f"[bold]{filled_chars}[/][dim]{empty_chars}[/]"
+        return _render_horizontal_bar(width, _filled(self.value, width))
 
 
 class HorizontalFaderContainer(Vertical):
@@ -339,65 +440,63 @@ class SidePanel(Vertical):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._bar_height = 10  # Default, will be updated
+        # Last drawn (height, filled) bar, or None when the bar is blank
+        self._last_bar: Optional[tuple[int, int]] = None
+        # Child widgets, kept from compose so updates skip DOM queries
+        self._content_widget: Optional[Static] = None
+        self._bar_widget: Optional[Static] = None
 
     def compose(self) -> ComposeResult:
+        self._content_widget = Static("[dim]None selected[/]", id="panel-content")
+        self._bar_widget = Static("", classes="panel-bar", id="panel-bar")
         yield Static("Selected Fader", classes="panel-title")
-        yield Static("[dim]None selected[/]", id="panel-content")
-        yield Static("", classes="panel-bar", id="panel-bar")
+        yield self._content_widget
+        yield self._bar_widget
 
     def on_resize(self, event) -> None:
         """Handle resize to update bar height."""
-        try:
-            bar = self.query_one("#panel-bar", Static)
-            if bar.size.height > 0:
-                self._bar_height = bar.size.height
-        except Exception:
-            pass
+        if self._bar_widget is not None and self._bar_widget.size.height > 0:
+            self._bar_height = self._bar_widget.size.height
 
     def update_fader(self, fader: Optional["FaderWidget"]) -> None:
         """Update the panel with fader details."""
-        try:
-            content = self.query_one("#panel-content", Static)
-            bar = self.query_one("#panel-bar", Static)
+        content = self._content_widget
+        bar = self._bar_widget
+        if content is None or bar is None:
+            return
 
-            # Update bar height from actual size
-            if bar.size.height > 0:
-                self._bar_height = bar.size.height
+        # Update bar height from actual size
+        if bar.size.height > 0:
+            self._bar_height = bar.size.height
 
-            if fader is None:
-                content.update("[dim]None selected[/]\n\nUse [bold]1-8[/] or [bold]h/l[/]\nto select a fader")
-                bar.update("")
-            else:
-                info = (
-                    f"[bold]{fader.label}[/]\n\n"
-                    f"[dim]Fader:[/]   {fader.fader_index + 1}\n"
-                    f"[dim]CC:[/]      {fader.cc_number}\n"
-                    f"[dim]Value:[/]   {fader.value}\n\n"
-                    f"[dim]j/k[/] adjust\n"
-                    f"[dim]Shift[/] fine  [dim]Ctrl[/] coarse\n"
-                    f"[dim]Space[/] reset to 0"
-                )
-                content.update(info)
-
-                # Render a visual bar filling available height
-                bar_content = self._render_large_bar(fader.value)
-                bar.update(bar_content)
-        except Exception:
-            pass
+        if fader is None:
+            content.update("[dim]None selected[/]\n\nUse [bold]1-8[/] or [bold]h/l[/]\nto select a fader")
+            bar.update("")
+            self._last_bar = None
+        else:
+            info = (
+                f"[bold]{fader.label}[/]\n\n"
+                f"[dim]Fader:[/]   {fader.fader_index + 1}\n"
+                f"[dim]CC:[/]      {fader.cc_number}\n"
+                f"[dim]Value:[/]   {fader.value}\n\n"
+                f"[dim]j/k[/] adjust\n"
+                f"[dim]Shift[/] fine  [dim]Ctrl[/] coarse\n"
+                f"[dim]Space[/] reset to 0"
+            )
+            content.update(info)
+
+            # Render a visual bar filling available height
+            bar_state = (self._bar_height, _filled(fader.value, self._bar_height))
+            if bar_state != self._last_bar:
+                bar.update(self._render_large_bar(fader.value))
+                self._last_bar = bar_state
 
     def _render_large_bar(self, value: int) -> str:
         """Render a visual bar for the side panel filling available height."""
         height = self._bar_height
-        filled = int((value / 127) * height)
-        empty = height - filled
-
-        lines = []
-        for _ in range(empty):
-            lines.append("[dim]░░░░░░░░░░░░░░░░░░[/]")
-        for _ in range(filled):
-            lines.append("[bold]█▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓█[/]")
-
-        return "\n".join(lines)
+        return _render_vertical_bar(
+            height, _filled(value, height), LARGE_BAR_ROW_EMPTY, LARGE_BAR_ROW_FULL
+        )
 
 
 class MainContent(Horizontal):
@@ -427,35 +526,37 @@ class StatusBar(Static):
 class ControlsFooter(ControlsFooterBase):
     """Custom footer with fadercat controls."""
 
+    CONTENT_VERTICAL = (
+        "[dim]h/l[/] select  "
+        "[dim]j/k[/] adjust  "
+        "[dim]Shift[/] fine  "
+        "[dim]Ctrl[/] coarse  "
+        "[dim]Space[/] reset  "
+        "[dim]v[/] horizontal  "
+        "[dim]?[/] help"
+    )
+
+    CONTENT_HORIZONTAL = (
+        "[dim]j/k[/] select  "
+        "[dim]h/l[/] adjust  "
+        "[dim]Shift[/] fine  "
+        "[dim]Ctrl[/] coarse  "
+        "[dim]Space[/] reset  "
+        "[dim]v[/] vertical  "
+        "[dim]?[/] help"
+    )
+
     def __init__(self, display_mode: str = MODE_VERTICAL) -> None:
-        content = self._make_content(display_mode)
-        super().__init__(content)
+        super().__init__(self._content_for(display_mode))
 
-    def _make_content(self, display_mode: str) -> str:
+    def _content_for(self, display_mode: str) -> str:
         if display_mode == MODE_HORIZONTAL:
-            return (
-                "[dim]j/k[/] select  "
-                "[dim]h/l[/] adjust  "
-                "[dim]Shift[/] fine  "
-                "[dim]Ctrl[/] coarse  "
-                "[dim]Space[/] reset  "
-                "[dim]v[/] vertical  "
-                "[dim]?[/] help"
-            )
-        else:
-            return (
-                "[dim]h/l[/] select  "
-                "[dim]j/k[/] adjust  "
-                "[dim]Shift[/] fine  "
-                "[dim]Ctrl[/] coarse  "
-                "[dim]Space[/] reset  "
-                "[dim]v[/] horizontal  "
-                "[dim]?[/] help"
-            )
+            return self.CONTENT_HORIZONTAL
+        return self.CONTENT_VERTICAL
 
     def set_mode(self, display_mode: str) -> None:
         """Update footer for new display mode."""
-        self.update(self._make_content(display_mode))
+        self.update(self._content_for(display_mode))
 
 
 class HelpScreen(HelpScreenBase):
@@ -562,11 +663,11 @@ class OutputPickerScreen(ModalScreen[tuple[str, bool] | None]):
         with Vertical(id="output-dialog"):
             yield Static("[bold]Select MIDI Output[/]", id="output-title")
             # Always show virtual port option first, then existing outputs
-            options = [Option(f"{self.VIRTUAL_PORT_PREFIX}{self.virtual_name}", id="__virtual__")]
+            options = [_virtual_option(self.virtual_name)]
             # Filter out any None or empty outputs
             for o in self.outputs:
                 if o:
-                    options.append(Option(o, id=o))
+                    options.append(_output_option(o))
             yield OptionList(*options, id="output-list")
             yield Static("[dim]enter[/] select  [dim]esc[/] cancel", id="output-hint")
 
@@ -641,10 +742,7 @@ class ChannelPickerScreen(ModalScreen[int | None]):
     def compose(self) -> ComposeResult:
         with Vertical(id="channel-dialog"):
             yield Static("[bold]Select MIDI Channel[/]", id="channel-title")
-            yield OptionList(
-                *[Option(f"Channel {i+1}", id=str(i)) for i in range(16)],
-                id="channel-list",
-            )
+            yield OptionList(*CHANNEL_OPTIONS, id="channel-list")
             yield Static("[dim]enter[/] select  [dim]esc[/] cancel", id="channel-hint")
 
     def on_mount(self) -> None:
@@ -686,89 +784,77 @@ class FaderScreen(Screen):
     is_virtual_port: reactive[bool] = reactive(False)
     display_mode: reactive[str] = reactive(MODE_VERTICAL)
 
-    def __init__(self, midi_engine: MidiEngine, initial_mode: str = MODE_VERTICAL) -> None:
+    def __init__(
+        self,
+        midi_engine: MidiEngine,
+        initial_mode: str = MODE_VERTICAL,
+        config_path: Optional[Path] = None,
+    ) -> None:
         super().__init__()
         self.midi = midi_engine
         self._faders: list[FaderWidget] = []
         self._horizontal_faders: list[HorizontalFaderWidget] = []
         self._initial_mode = initial_mode
+        self._config_path = config_path or get_config_path("fadercat")
+        # Latest unsent value per CC number, flushed once per frame
+        self._pending_cc: dict[int, int] = {}
+        self._flush_timer = None
+        self._last_status: Optional[str] = None
+        # Widgets updated on the hot path, kept to skip DOM queries
+        self._status_widget: Optional[StatusBar] = None
+        self._footer_widget: Optional[ControlsFooter] = None
+        self._side_panel: Optional[SidePanel] = None
 
     def compose(self) -> ComposeResult:
-        yield StatusBar(self._make_status())
-        yield MainContent(id="main-content")
-        yield ControlsFooter(self._initial_mode)
+        self._last_status = self._make_status()
+        self._status_widget = StatusBar(self._last_status)
+        self._footer_widget = ControlsFooter(self._initial_mode)
+        self._side_panel = SidePanel()
+        self._faders = [
+            FaderWidget(
+                fader_index=i,
+                cc_number=DEFAULT_CC_NUMBERS[i],
+                label=DEFAULT_FADER_LABELS[i],
+                key_up=FADER_LABELS_UP[i],
+                key_down=FADER_LABELS_DOWN[i],
+                id=f"fader-{i}",
+            )
+            for i in range(8)
+        ]
+        self._horizontal_faders = [
+            HorizontalFaderWidget(
+                fader_index=i,
+                cc_number=DEFAULT_CC_NUMBERS[i],
+                label=DEFAULT_FADER_LABELS[i],
+                id=f"hfader-{i}",
+            )
+            for i in range(8)
+        ]
+
+        yield self._status_widget
+        # Both layouts are built once; toggling the mode only flips visibility
+        with MainContent(id="main-content"):
+            with FaderContainer(id="vertical-faders"):
+                yield from self._faders
+            yield self._side_panel
+            with HorizontalFaderContainer(id="horizontal-faders"):
+                yield from self._horizontal_faders
+        yield self._footer_widget
 
     def on_mount(self) -> None:
-        """Build initial fader display after mount."""
+        """Show the initial display mode after mount."""
         self.display_mode = self._initial_mode
-        self._rebuild_fader_display()
-
-    def _rebuild_fader_display(self) -> None:
-        """Rebuild the fader display for current mode."""
-        try:
-            main_content = self.query_one("#main-content", MainContent)
-            # Clear existing content
-            main_content.remove_children()
-
-            # Store current values if we have faders
-            values = []
-            if self._faders:
-                values = [f.value for f in self._faders]
-            elif self._horizontal_faders:
-                values = [f.value for f in self._horizontal_faders]
-
-            self._faders = []
-            self._horizontal_faders = []
-
-            if self.display_mode == MODE_HORIZONTAL:
-                # Build horizontal layout
-                container = HorizontalFaderContainer()
-                main_content.mount(container)
-                for i in range(8):
-                    fader = HorizontalFaderWidget(
-                        fader_index=i,
-                        cc_number=DEFAULT_CC_NUMBERS[i],
-                        label=DEFAULT_FADER_LABELS[i],
-                        id=f"hfader-{i}",
-                    )
-                    if i < len(values):
-                        fader.value = values[i]
-                    if i == self.selected_fader:
-                        fader.selected = True
-                    self._horizontal_faders.append(fader)
-                    container.mount(fader)
-            else:
-                # Build vertical layout
-                fader_container = FaderContainer()
-                main_content.mount(fader_container)
-                for i in range(8):
-                    fader = FaderWidget(
-                        fader_index=i,
-                        cc_number=DEFAULT_CC_NUMBERS[i],
-                        label=DEFAULT_FADER_LABELS[i],
-                        key_up=FADER_LABELS_UP[i],
-                        key_down=FADER_LABELS_DOWN[i],
-                        id=f"fader-{i}",
-                    )
-                    if i < len(values):
-                        fader.value = values[i]
-                    if i == self.selected_fader:
-                        fader.selected = True
-                    self._faders.append(fader)
-                    fader_container.mount(fader)
-                # Add side panel for vertical mode
-                main_content.mount(SidePanel())
-                self._update_side_panel()
-
-            # Update footer
-            try:
-                footer = self.query_one(ControlsFooter)
-                footer.set_mode(self.display_mode)
-            except Exception:
-                pass
-
-        except Exception:
-            pass
+        self._show_display_mode()
+
+    def _show_display_mode(self) -> None:
+        """Show the widgets for the current display mode and hide the others."""
+        vertical = self.display_mode != MODE_HORIZONTAL
+        self.query_one("#vertical-faders").display = vertical
+        self._side_panel.display = vertical
+        self.query_one("#horizontal-faders").display = not vertical
+        if vertical:
+            self._update_side_panel()
+        self._footer_widget.set_mode(self.display_mode)
 
     def _get_active_faders(self):
         """Get the currently active fader list based on mode."""
@@ -793,12 +879,12 @@ class FaderScreen(Screen):
         )
 
     def _update_status(self) -> None:
-        """Update the status bar."""
-        try:
-            status = self.query_one(StatusBar)
-            status.update(self._make_status())
-        except Exception:
-            pass
+        """Update the status bar if its content changed."""
+        content = self._make_status()
+        if content == self._last_status or self._status_widget is None:
+            return
+        self._status_widget.update(content)
+        self._last_status = content
 
     def watch_midi_output(self, output: str) -> None:
         """React to MIDI output changes."""
@@ -812,37 +898,27 @@ class FaderScreen(Screen):
         """React to virtual port changes."""
         self._update_status()
 
-    def watch_selected_fader(self, index: int) -> None:
+    def watch_selected_fader(self, old_index: int, index: int) -> None:
         """React to fader selection changes."""
+        # Only the previously and newly selected faders change state
         faders = self._get_active_faders()
-        for i, fader in enumerate(faders):
-            fader.selected = (i == index)
-        self._update_status()
+        if 0 <= old_index < len(faders):
+            faders[old_index].selected = False
+        if 0 <= index < len(faders):
+            faders[index].selected = True
         if self.display_mode == MODE_VERTICAL:
             self._update_side_panel()
 
     def _update_side_panel(self) -> None:
         """Update the side panel with selected fader info (vertical mode only)."""
-        if self.display_mode != MODE_VERTICAL:
+        panel = self._side_panel
+        if self.display_mode != MODE_VERTICAL or panel is None:
             return
-        try:
-            panel = self.query_one(SidePanel)
-            faders = self._get_active_faders()
-            if 0 <= self.selected_fader < len(faders):
-                panel.update_fader(faders[self.selected_fader])
-            else:
-                panel.update_fader(None)
-        except Exception:
-            pass
-
-    def _get_step(self, shift: bool, ctrl: bool) -> int:
-        """Get step size based on modifiers."""
-        if shift:
-            return STEP_FINE
-        elif ctrl:
-            return STEP_COARSE
+        faders = self._get_active_faders()
+        if 0 <= self.selected_fader < len(faders):
+            panel.update_fader(faders[self.selected_fader])
         else:
-            return STEP_NORMAL
+            panel.update_fader(None)
 
     def _adjust_fader(self, index: int, delta: int) -> None:
         """Adjust a fader's value and send CC."""
@@ -852,69 +928,52 @@ class FaderScreen(Screen):
             new_value = max(0, min(127, fader.value + delta))
             if new_value != fader.value:
                 fader.value = new_value
-                self.midi.cc(fader.cc_number, new_value)
-                # Update side panel if this is the selected fader (vertical mode)
-                if index == self.selected_fader and self.display_mode == MODE_VERTICAL:
-                    self._update_side_panel()
-
-    def on_key(self, event) -> None:
-        """Handle key press for fader control."""
-        key = event.key
+                self._queue_cc(fader.cc_number, new_value)
 
-        # Check for modifier keys
-        # Shift+letter comes through as uppercase, not "shift+letter"
-        has_ctrl = key.startswith("ctrl+")
+    def _queue_cc(self, cc_number: int, value: int) -> None:
+        """Queue a CC value to be sent on the next flush.
 
-        # Extract base key
-        base_key = key
-        if has_ctrl:
-            base_key = key[5:]  # Remove "ctrl+"
+        Key repeat can adjust a fader many times per frame; only the latest
+        value per CC is sent, along with one side panel refresh.
+        """
+        self._pending_cc[cc_number] = value
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(FLUSH_INTERVAL, self._flush_adjustments)
 
-        # Detect shift by checking if key is uppercase letter
-        has_shift = len(base_key) == 1 and base_key.isupper()
-        if has_shift:
-            base_key = base_key.lower()
+    def _flush_adjustments(self) -> None:
+        """Send pending CC values and refresh the side panel.
 
-        # Number keys 1-8 for fader selection
-        if base_key in "12345678":
-            self.selected_fader = int(base_key) - 1
+        Also called directly, ahead of the timer, before the channel or port
+        changes or the app quits, so pending values go out where they were
+        meant to.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        if not self._pending_cc:
             return
+        pending = self._pending_cc
+        self._pending_cc = {}
+        self.midi.cc_batch(pending.items())
+        if self.display_mode == MODE_VERTICAL:
+            self._update_side_panel()
 
-        # Mode-specific key bindings
-        # Vertical: h/l = select, j/k = adjust
-        # Horizontal: j/k = select, h/l = adjust
-        if self.display_mode == MODE_HORIZONTAL:
-            # Horizontal mode: j/k select, h/l adjust
-            if base_key == "j":
-                self._select_next()
-                return
-            if base_key == "k":
-                self._select_prev()
-                return
-            if base_key == "h" and self.selected_fader >= 0:
-                step = self._get_step(has_shift, has_ctrl)
-                self._adjust_fader(self.selected_fader, -step)
-                return
-            if base_key == "l" and self.selected_fader >= 0:
-                step = self._get_step(has_shift, has_ctrl)
-                self._adjust_fader(self.selected_fader, step)
-                return
-        else:
-            # Vertical mode: h/l select, j/k adjust
-            if base_key == "h":
+    def on_key(self, event) -> None:
+        """Handle key press for fader control."""
+        key_map = KEY_MAPS.get(self.display_mode, KEY_MAPS[MODE_VERTICAL])
+        entry = key_map.get(event.key)
+        if entry is None:
+            return
+        action, amount = entry
+        if action == "choose":
+            self.selected_fader = amount
+        elif action == "select":
+            if amount < 0:
                 self._select_prev()
-                return
-            if base_key == "l":
+            else:
                 self._select_next()
-                return
-            if base_key == "j" and self.selected_fader >= 0:
-                step = self._get_step(has_shift, has_ctrl)
-                self._adjust_fader(self.selected_fader, -step)
-                return
-            if base_key == "k" and self.selected_fader >= 0:
-                step = self._get_step(has_shift, has_ctrl)
-                self._adjust_fader(self.selected_fader, step)
-                return
+        elif self.selected_fader >= 0:
+            self._adjust_fader(self.selected_fader, amount)
 
     def action_select_output(self) -> None:
         """Open output selection dialog."""
@@ -924,6 +983,7 @@ class FaderScreen(Screen):
         def handle_output(result: tuple[str, bool] | None) -> None:
             if result:
                 port_name, is_virtual = result
+                self._flush_adjustments()
                 if is_virtual:
                     if self.midi.open_virtual(port_name):
                         self.midi_output = port_name
@@ -934,7 +994,7 @@ class FaderScreen(Screen):
                         self.is_virtual_port = False
 
         self.app.push_screen(
-            OutputPickerScreen(outputs, self.midi_output or None, DEFAULT_PORT_NAME),
+            OutputPickerScreen(outputs, self.midi_output or None, self.midi.virtual_port_name),
             handle_output
         )
 
@@ -943,6 +1003,7 @@ class FaderScreen(Screen):
 
         def handle_channel(channel: int | None) -> None:
             if channel is not None:
+                self._flush_adjustments()
                 self.midi.set_channel(channel)
                 self.midi_channel = channel
 
@@ -952,12 +1013,11 @@ class FaderScreen(Screen):
 
     def action_select_theme(self) -> None:
         """Open theme picker."""
-        config_path = get_config_path("fadercat")
 
         def handle_theme(theme: str | None) -> None:
             if theme:
                 self.app.theme = theme
-                set_theme(theme, config_path)
+                set_theme(theme, self._config_path)
 
         self.app.push_screen(ThemePickerScreen(self.app.theme), handle_theme)
 
@@ -970,10 +1030,9 @@ class FaderScreen(Screen):
         faders = self._get_active_faders()
         if 0 <= self.selected_fader < len(faders):
             fader = faders[self.selected_fader]
-            fader.value = 0
-            self.midi.cc(fader.cc_number, 0)
-            if self.display_mode == MODE_VERTICAL:
-                self._update_side_panel()
+            if fader.value != 0:
+                fader.value = 0
+                self._queue_cc(fader.cc_number, 0)
 
     def action_deselect(self) -> None:
         """Deselect current fader."""
@@ -981,15 +1040,21 @@ class FaderScreen(Screen):
 
     def action_toggle_mode(self) -> None:
         """Toggle between vertical and horizontal display modes."""
+        previous = self._get_active_faders()
         if self.display_mode == MODE_VERTICAL:
             self.display_mode = MODE_HORIZONTAL
         else:
             self.display_mode = MODE_VERTICAL
-        self._rebuild_fader_display()
-        self._update_status()
+        # Apply the whole switch in one repaint
+        with self.app.batch_update():
+            # Carry values and selection over to the newly shown faders
+            for i, (old, new) in enumerate(zip(previous, self._get_active_faders())):
+                new.value = old.value
+                new.selected = i == self.selected_fader
+            self._show_display_mode()
+            self._update_status()
         # Persist mode preference
-        config_path = get_config_path("fadercat")
-        set_display_mode(self.display_mode, config_path)
+        set_display_mode(self.display_mode, self._config_path)
 
     def _select_prev(self) -> None:
         """Move selection to previous fader."""
@@ -1019,22 +1084,26 @@ class FadercatApp(App):
         Binding("ctrl+c", "quit", "Quit", show=False),
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, port_name: str = DEFAULT_PORT_NAME) -> None:
         super().__init__()
-        self.midi = MidiEngine()
+        self.midi = MidiEngine(virtual_port_name=port_name)
+        self._config_path = get_config_path("fadercat")
+        self._fader_screen: FaderScreen | None = None
         register_themes(self)
 
     def on_mount(self) -> None:
         """Load theme and push fader screen on mount."""
-        config_path = get_config_path("fadercat")
-        theme = get_theme(config_path)
+        theme = get_theme(self._config_path)
         self.theme = theme
 
         # Load display mode preference
-        display_mode = get_display_mode(config_path)
+        display_mode = get_display_mode(self._config_path)
 
         # Push the fader screen with saved mode
-        fader_screen = FaderScreen(self.midi, initial_mode=display_mode)
+        fader_screen = FaderScreen(
+            self.midi, initial_mode=display_mode, config_path=self._config_path
+        )
+        self._fader_screen = fader_screen
         self.push_screen(fader_screen)
 
         # Open virtual MIDI port after screen is ready
@@ -1042,16 +1111,18 @@ class FadercatApp(App):
 
     def _open_virtual_port(self) -> None:
         """Open virtual MIDI port."""
-        if self.midi.open_virtual(DEFAULT_PORT_NAME):
+        if self.midi.open_virtual():
             try:
                 fader_screen = self.query_one(FaderScreen)
-                fader_screen.midi_output = DEFAULT_PORT_NAME
+                fader_screen.midi_output = self.midi.port_name
                 fader_screen.is_virtual_port = True
             except Exception:
                 pass
 
     def action_quit(self) -> None:
-        """Quit cleanly."""
+        """Quit cleanly, sending any fader values still waiting to flush."""
+        if self._fader_screen is not None:
+            self._fader_screen._flush_adjustments()
         self.midi.disconnect()
         self.exit()
 
@@ -1,11 +1,19 @@
 """Entry point for gridcat."""
 
-import argparse
 import sys
 
 
 def main() -> None:
     """Main entry point with CLI argument parsing."""
+    # Plain launch: skip building the parser entirely
+    if len(sys.argv) == 1:
+        from gridcat.tui import GridcatApp
+
+        GridcatApp().run()
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="gridcat",
         description="TUI MIDI grid controller - play notes with your keyboard",
@@ -47,14 +55,8 @@ connect to in your DAW or other MIDI software.
 
     # Import and run the TUI
     from gridcat.tui import GridcatApp
-    from gridcat.midi import DEFAULT_PORT_NAME
-
-    # Update default port name if specified
-    if args.port != DEFAULT_PORT_NAME:
-        import gridcat.midi
-        gridcat.midi.DEFAULT_PORT_NAME = args.port
 
-    app = GridcatApp()
+    app = GridcatApp(port_name=args.port)
     app.run()
 
 
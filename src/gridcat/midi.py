@@ -11,8 +11,13 @@ DEFAULT_PORT_NAME = "Gridcat"
 class MidiEngine:
     """MIDI output engine for sending notes."""
 
-    def __init__(self) -> None:
-        """Initialize the MIDI engine."""
+    def __init__(self, virtual_port_name: str = DEFAULT_PORT_NAME) -> None:
+        """Initialize the MIDI engine.
+
+        Args:
+            virtual_port_name: Name used by open_virtual() when none is given.
+        """
+        self.virtual_port_name = virtual_port_name
         self.output: Optional[mido.ports.BaseOutput] = None
         self.channel: int = 0  # 0-15 (displayed as 1-16)
         self.port_name: str = ""
@@ -26,17 +31,19 @@ class MidiEngine:
         """
         return mido.get_output_names()
 
-    def open_virtual(self, port_name: str = DEFAULT_PORT_NAME) -> bool:
+    def open_virtual(self, port_name: Optional[str] = None) -> bool:
         """Open a virtual MIDI output port.
 
         Creates a virtual port that other applications can connect to.
 
         Args:
-            port_name: Name for the virtual port.
+            port_name: Name for the virtual port. Defaults to virtual_port_name.
 
         Returns:
             True if port opened successfully, False otherwise.
         """
+        if port_name is None:
+            port_name = self.virtual_port_name
         try:
             if self.output:
                 self.output.close()
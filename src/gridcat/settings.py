@@ -1,6 +1,6 @@
 """Settings management for gridcat."""
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Literal
 
 from cat_common import get_config_path, load_config, save_config
@@ -13,7 +13,7 @@ PlayMode = Literal["hold", "trigger"]
 ViewMode = Literal["grid", "keyboard"]
 
 
-@dataclass
+@dataclass(slots=True)
 class GridcatSettings:
     """Gridcat application settings."""
 
@@ -49,7 +49,13 @@ class GridcatSettings:
         """Save settings to config file."""
         config_path = get_config_path("gridcat")
         config = load_config(config_path)
-        config["settings"] = asdict(self)
+        config["settings"] = {
+            "view": self.view,
+            "play_mode": self.play_mode,
+            "hold_initial_delay_ms": self.hold_initial_delay_ms,
+            "hold_repeat_delay_ms": self.hold_repeat_delay_ms,
+            "trigger_duration_ms": self.trigger_duration_ms,
+        }
         save_config(config, config_path)
 
 
@@ -1,14 +1,18 @@
 """TUI interface for gridcat - a MIDI grid controller."""
 
+import heapq
 import time
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache, partial
+from typing import Callable, Optional
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.reactive import reactive
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import Static, OptionList, Label
 from textual.widgets.option_list import Option
 
@@ -35,6 +39,9 @@ KEY_ROWS = [
     ["z", "x", "c", "v", "b", "n", "m", "comma"],
 ]
 
+# Grid key -> (row, col), so key handling is a single lookup
+KEY_TO_POS = {key: (r, c) for r, row in enumerate(KEY_ROWS) for c, key in enumerate(row)}
+
 # Display labels for keys (what to show on the pads)
 KEY_LABELS = [
     ["1", "2", "3", "4", "5", "6", "7", "8"],
@@ -43,6 +50,9 @@ KEY_LABELS = [
     ["Z", "X", "C", "V", "B", "N", "M", ","],
 ]
 
+# (key, label) pairs per grid row, so building the grid walks one structure
+KEY_GRID = [list(zip(keys, labels)) for keys, labels in zip(KEY_ROWS, KEY_LABELS)]
+
 # Note names for display
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 
@@ -85,6 +95,30 @@ for i, key in enumerate(LOWER_BLACK_KEYS):
     PIANO_KEY_MAP[key] = ("lower", "black", LOWER_BLACK_OFFSETS[i], LOWER_BLACK_LABELS[i])
 
 
+def _build_key_events(keys) -> dict[str, tuple[str, bool]]:
+    """Map key event names to (base key, has_shift) for the given keys.
+
+    Ctrl+key is reserved for navigation, so it is deliberately left out.
+    """
+    events = {}
+    for key in keys:
+        events[key] = (key, False)
+        events[f"shift+{key}"] = (key, True)
+    if "comma" in keys:
+        events[","] = ("comma", False)
+        events["shift+,"] = ("comma", True)
+    return events
+
+
+# Key event name -> (base key, has_shift), so on_key is a single lookup
+GRID_KEY_EVENTS = _build_key_events(KEY_TO_POS)
+PIANO_KEY_EVENTS = _build_key_events(PIANO_KEY_MAP)
+
+
+# Names for every MIDI note, indexed by note number
+NOTE_NAME_TABLE = tuple(f"{NOTE_NAMES[n % 12]}{(n // 12) - 1}" for n in range(128))
+
+
 def note_to_name(note: int) -> str:
     """Convert MIDI note number to note name.
 
@@ -94,6 +128,8 @@ def note_to_name(note: int) -> str:
     Returns:
         Note name like "C4" or "F#3".
     """
+    if 0 <= note < 128:
+        return NOTE_NAME_TABLE[note]
     octave = (note // 12) - 1
     name = NOTE_NAMES[note % 12]
     return f"{name}{octave}"
@@ -102,6 +138,8 @@ def note_to_name(note: int) -> str:
 class PadConfig:
     """Configuration for a single pad."""
 
+    __slots__ = ("msg_type", "note", "cc_number", "cc_value", "pc_number", "velocity", "label")
+
     def __init__(
         self,
         msg_type: str = "note",  # "note", "cc", "pc"
@@ -167,12 +205,22 @@ class PadWidget(Static):
         self.config = config
         self.row = row
         self.col = col
-
-    def compose(self) -> ComposeResult:
-        yield Label("")  # Placeholder, we render in render()
+        # Rendered markup, rebuilt only after invalidate_render()
+        self._cached_render: Optional[str] = None
 
     def render(self) -> str:
         """Render the pad content."""
+        if self._cached_render is None:
+            self._cached_render = self._compute_render()
+        return self._cached_render
+
+    def invalidate_render(self) -> None:
+        """Rebuild the pad content after its config changed."""
+        self._cached_render = None
+        self.refresh()
+
+    def _compute_render(self) -> str:
+        """Build the pad markup from its config."""
         cfg = self.config
 
         # Use custom label or generate from config
@@ -402,6 +450,48 @@ class PadRow(Horizontal):
     """
 
 
+class ReleaseQueue:
+    """Pending trigger-mode releases driven by a single timer.
+
+    Each release is a (due time, key) heap entry, and only one timer is
+    armed at a time, for the earliest due release.
+    """
+
+    def __init__(self, owner: Widget, release: Callable[[str], None]) -> None:
+        """Initialize the queue.
+
+        Args:
+            owner: Widget whose timers drive the queue.
+            release: Called with the key of each release that falls due.
+        """
+        self._owner = owner
+        self._release = release
+        self._pending: list[tuple[float, str]] = []
+        self._timer: Timer | None = None
+
+    def push(self, key: str, delay: float) -> None:
+        """Release key after delay seconds."""
+        due = time.monotonic() + delay
+        # Re-arm only if this release is now the earliest, e.g. after the
+        # trigger duration was shortened
+        rearm = not self._pending or due < self._pending[0][0]
+        heapq.heappush(self._pending, (due, key))
+        if rearm:
+            if self._timer is not None:
+                self._timer.stop()
+            self._timer = self._owner.set_timer(delay, self._drain)
+
+    def _drain(self) -> None:
+        """Release every key that is due and re-arm for the next one."""
+        self._timer = None
+        pending = self._pending
+        now = time.monotonic()
+        while pending and pending[0][0] <= now:
+            self._release(heapq.heappop(pending)[1])
+        if pending:
+            self._timer = self._owner.set_timer(pending[0][0] - now, self._drain)
+
+
 @dataclass
 class MidiLogEntry:
     """A logged MIDI message."""
@@ -591,15 +681,16 @@ class StatusBar(Static):
 class ControlsFooter(ControlsFooterBase):
     """Custom footer with gridcat controls."""
 
+    CONTENT = (
+        "[dim]↑↓[/] octave  "
+        "[dim]Shift[/] soft  "
+        "[dim]Ctrl+hjkl[/] select  "
+        "[dim]:[/] commands  "
+        "[dim]?[/] help"
+    )
+
     def __init__(self) -> None:
-        content = (
-            "[dim]↑↓[/] octave  "
-            "[dim]Shift[/] soft  "
-            "[dim]Ctrl+hjkl[/] select  "
-            "[dim]:[/] commands  "
-            "[dim]?[/] help"
-        )
-        super().__init__(content)
+        super().__init__(self.CONTENT)
 
 
 class HelpScreen(HelpScreenBase):
@@ -649,6 +740,28 @@ COMMANDS_KEYBOARD = [
 COMMANDS = COMMANDS_GRID
 
 
+# Picker options are immutable, so they are built once and shared
+CHANNEL_OPTIONS = [Option(f"Channel {i+1}", id=str(i)) for i in range(16)]
+
+
+@lru_cache(maxsize=32)
+def _command_option(cmd: str, desc: str) -> Option:
+    """Option for a command palette entry."""
+    return Option(f"{cmd}  [dim]{desc}[/]", id=cmd)
+
+
+@lru_cache(maxsize=64)
+def _output_option(port_name: str) -> Option:
+    """Option for an existing MIDI output port."""
+    return Option(port_name, id=port_name)
+
+
+@lru_cache(maxsize=8)
+def _virtual_option(port_name: str) -> Option:
+    """Option for creating a virtual port with the given name."""
+    return Option(f"Virtual: {port_name}", id="__virtual__")
+
+
 class CommandPalette(ModalScreen[str | None]):
     """Command palette for gridcat settings."""
 
@@ -701,6 +814,10 @@ class CommandPalette(ModalScreen[str | None]):
         super().__init__()
         self.filter_text = ""
         self.commands = commands if commands is not None else COMMANDS
+        # (lowercased command, option) pairs so filtering never rebuilds options
+        self._command_options = [
+            (cmd.lower(), _command_option(cmd, desc)) for cmd, desc in self.commands
+        ]
 
     def compose(self) -> ComposeResult:
         from textual.widgets import Input
@@ -708,41 +825,42 @@ class CommandPalette(ModalScreen[str | None]):
         with Container(id="palette-dialog"):
             yield Static("Commands", id="palette-title")
             yield Input(placeholder="Type to filter...", id="palette-input")
-            yield OptionList(
-                *[Option(f"{cmd}  [dim]{desc}[/]", id=cmd) for cmd, desc in self.commands],
+            self._option_list = OptionList(
+                *[option for _, option in self._command_options],
                 id="palette-list",
             )
+            yield self._option_list
             yield Static("[dim]↑↓[/] navigate  [dim]enter[/] run  [dim]esc[/] cancel", id="palette-hint")
 
     def on_mount(self) -> None:
         self.query_one("#palette-input").focus()
-        option_list = self.query_one("#palette-list", OptionList)
-        option_list.highlighted = 0
+        self._option_list.highlighted = 0
 
     def on_input_changed(self, event) -> None:
         """Filter commands as user types."""
         from textual.widgets import Input
 
         self.filter_text = event.value.lower()
-        option_list = self.query_one("#palette-list", OptionList)
-        option_list.clear_options()
-
-        filtered = [(cmd, desc) for cmd, desc in self.commands if self.filter_text in cmd.lower()]
-        option_list.add_options([Option(f"{cmd}  [dim]{desc}[/]", id=cmd) for cmd, desc in filtered])
+        option_list = self._option_list
 
+        filtered = [option for cmd, option in self._command_options if self.filter_text in cmd]
+        option_list.clear_options()
         if filtered:
+            option_list.add_options(filtered)
             option_list.highlighted = 0
 
     def _move_highlight(self, delta: int) -> None:
         """Move the option list highlight by delta."""
-        option_list = self.query_one("#palette-list", OptionList)
+        option_list = self._option_list
         if option_list.option_count == 0:
             return
         if option_list.highlighted is None:
             option_list.highlighted = 0
         else:
-            new_idx = option_list.highlighted + delta
-            option_list.highlighted = max(0, min(new_idx, option_list.option_count - 1))
+            new_idx = max(0, min(option_list.highlighted + delta, option_list.option_count - 1))
+            # Holding an arrow at either end of the list is a no-op
+            if new_idx != option_list.highlighted:
+                option_list.highlighted = new_idx
 
     def action_cursor_down(self) -> None:
         self._move_highlight(1)
@@ -754,7 +872,7 @@ class CommandPalette(ModalScreen[str | None]):
         self.dismiss(None)
 
     def action_select(self) -> None:
-        option_list = self.query_one("#palette-list", OptionList)
+        option_list = self._option_list
         if option_list.highlighted is not None and option_list.option_count > 0:
             option = option_list.get_option_at_index(option_list.highlighted)
             if option:
@@ -811,23 +929,18 @@ class OutputPickerScreen(ModalScreen[tuple[str, bool] | None]):
         outputs: list[str],
         current: Optional[str] = None,
         is_virtual: bool = False,
+        virtual_name: str = DEFAULT_PORT_NAME,
     ) -> None:
         super().__init__()
         self.outputs = outputs
         self.current = current
         self.is_virtual = is_virtual
+        self.virtual_name = virtual_name
 
     def compose(self) -> ComposeResult:
-        # Build option list with virtual port first, then existing outputs
-        options = []
-
-        # Virtual port option (always first)
-        virtual_label = f"Virtual: {DEFAULT_PORT_NAME}"
-        options.append(Option(virtual_label, id="__virtual__"))
-
-        # Existing outputs
-        for output in self.outputs:
-            options.append(Option(output, id=output))
+        # Virtual port option first, then existing outputs
+        options = [_virtual_option(self.virtual_name)]
+        options.extend(_output_option(output) for output in self.outputs)
 
         with Vertical(id="output-dialog"):
             yield Static("[bold]Select MIDI Output[/]", id="output-title")
@@ -859,7 +972,7 @@ class OutputPickerScreen(ModalScreen[tuple[str, bool] | None]):
             option = option_list.get_option_at_index(option_list.highlighted)
             if option:
                 if option.id == "__virtual__":
-                    self.dismiss((DEFAULT_PORT_NAME, True))
+                    self.dismiss((self.virtual_name, True))
                 else:
                     self.dismiss((option.id, False))
                 return
@@ -868,7 +981,7 @@ class OutputPickerScreen(ModalScreen[tuple[str, bool] | None]):
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         if event.option:
             if event.option.id == "__virtual__":
-                self.dismiss((DEFAULT_PORT_NAME, True))
+                self.dismiss((self.virtual_name, True))
             else:
                 self.dismiss((event.option.id, False))
 
@@ -912,10 +1025,7 @@ class ChannelPickerScreen(ModalScreen[int | None]):
     def compose(self) -> ComposeResult:
         with Vertical(id="channel-dialog"):
             yield Static("[bold]Select MIDI Channel[/]", id="channel-title")
-            yield OptionList(
-                *[Option(f"Channel {i+1}", id=str(i)) for i in range(16)],
-                id="channel-list",
-            )
+            yield OptionList(*CHANNEL_OPTIONS, id="channel-list")
             yield Static("[dim]enter[/] select  [dim]esc[/] cancel", id="channel-hint")
 
     def on_mount(self) -> None:
@@ -1005,46 +1115,66 @@ class PadEditorScreen(ModalScreen[PadConfig | None]):
             # Message type selector
             with Horizontal(classes="editor-row"):
                 yield Label("Type:")
-                yield Select(
+                self._msg_type = Select(
                     [("Note", "note"), ("CC", "cc"), ("Program", "pc")],
                     value=self.config.msg_type,
                     id="msg-type",
                 )
+                yield self._msg_type
 
             # Note settings
-            with Horizontal(classes="editor-row", id="note-row"):
+            with Horizontal(classes="editor-row", id="note-row") as self._note_row:
                 yield Label("Note:")
-                yield Input(str(self.config.note), id="note-input", type="integer")
+                self._note_input = Input(str(self.config.note), id="note-input", type="integer")
+                yield self._note_input
 
             # Velocity
-            with Horizontal(classes="editor-row", id="velocity-row"):
+            with Horizontal(classes="editor-row", id="velocity-row") as self._velocity_row:
                 yield Label("Velocity:")
-                yield Input(str(self.config.velocity), id="velocity-input", type="integer")
+                self._velocity_input = Input(
+                    str(self.config.velocity), id="velocity-input", type="integer"
+                )
+                yield self._velocity_input
 
             # CC settings
-            with Horizontal(classes="editor-row", id="cc-num-row"):
+            with Horizontal(classes="editor-row", id="cc-num-row") as self._cc_num_row:
                 yield Label("CC Number:")
-                yield Input(str(self.config.cc_number), id="cc-num-input", type="integer")
+                self._cc_num_input = Input(
+                    str(self.config.cc_number), id="cc-num-input", type="integer"
+                )
+                yield self._cc_num_input
 
-            with Horizontal(classes="editor-row", id="cc-val-row"):
+            with Horizontal(classes="editor-row", id="cc-val-row") as self._cc_val_row:
                 yield Label("CC Value:")
-                yield Input(str(self.config.cc_value), id="cc-val-input", type="integer")
+                self._cc_val_input = Input(
+                    str(self.config.cc_value), id="cc-val-input", type="integer"
+                )
+                yield self._cc_val_input
 
             # PC settings
-            with Horizontal(classes="editor-row", id="pc-row"):
+            with Horizontal(classes="editor-row", id="pc-row") as self._pc_row:
                 yield Label("Program:")
-                yield Input(str(self.config.pc_number), id="pc-input", type="integer")
+                self._pc_input = Input(str(self.config.pc_number), id="pc-input", type="integer")
+                yield self._pc_input
 
             # Custom label
             with Horizontal(classes="editor-row"):
                 yield Label("Label:")
-                yield Input(self.config.label, id="label-input", placeholder="(auto)")
+                self._label_input = Input(self.config.label, id="label-input", placeholder="(auto)")
+                yield self._label_input
+
+            # Message type -> field rows shown for it
+            self._field_rows = {
+                "note": (self._note_row, self._velocity_row),
+                "cc": (self._cc_num_row, self._cc_val_row),
+                "pc": (self._pc_row,),
+            }
 
             yield Static("[dim]enter[/] save  [dim]esc[/] cancel", id="editor-hint")
 
     def on_mount(self) -> None:
         self._update_visibility()
-        self.query_one("#msg-type").focus()
+        self._msg_type.focus()
 
     def on_select_changed(self, event) -> None:
         """Update field visibility when type changes."""
@@ -1053,40 +1183,25 @@ class PadEditorScreen(ModalScreen[PadConfig | None]):
 
     def _update_visibility(self) -> None:
         """Show/hide fields based on message type."""
-        try:
-            msg_type = self.query_one("#msg-type", Select).value
-
-            # Note fields
-            self.query_one("#note-row").display = (msg_type == "note")
-            self.query_one("#velocity-row").display = (msg_type == "note")
-
-            # CC fields
-            self.query_one("#cc-num-row").display = (msg_type == "cc")
-            self.query_one("#cc-val-row").display = (msg_type == "cc")
-
-            # PC fields
-            self.query_one("#pc-row").display = (msg_type == "pc")
-        except Exception:
-            pass
+        msg_type = self._msg_type.value
+        for row_type, rows in self._field_rows.items():
+            for row in rows:
+                row.display = row_type == msg_type
 
     def action_cancel(self) -> None:
         self.dismiss(None)
 
     def action_save(self) -> None:
         """Save the configuration."""
-        from textual.widgets import Input, Select
-
         try:
-            msg_type = self.query_one("#msg-type", Select).value
-
             new_config = PadConfig(
-                msg_type=msg_type,
-                note=int(self.query_one("#note-input", Input).value or "60"),
-                velocity=int(self.query_one("#velocity-input", Input).value or "100"),
-                cc_number=int(self.query_one("#cc-num-input", Input).value or "1"),
-                cc_value=int(self.query_one("#cc-val-input", Input).value or "127"),
-                pc_number=int(self.query_one("#pc-input", Input).value or "0"),
-                label=self.query_one("#label-input", Input).value,
+                msg_type=self._msg_type.value,
+                note=int(self._note_input.value or "60"),
+                velocity=int(self._velocity_input.value or "100"),
+                cc_number=int(self._cc_num_input.value or "1"),
+                cc_value=int(self._cc_val_input.value or "127"),
+                pc_number=int(self._pc_input.value or "0"),
+                label=self._label_input.value,
             )
 
             # Clamp values
@@ -1265,29 +1380,33 @@ class GridScreen(Screen):
     midi_output: reactive[str] = reactive("")
     midi_channel: reactive[int] = reactive(0)
     is_virtual_port: reactive[bool] = reactive(False)
-    selected_row: reactive[int] = reactive(-1)  # -1 = no selection
-    selected_col: reactive[int] = reactive(-1)
+    # (row, col) of the selected pad, (-1, -1) = no selection. One reactive
+    # so a move that changes both coordinates fires a single watcher.
+    selected_pos: reactive[tuple[int, int]] = reactive((-1, -1))
 
     def __init__(self, midi_engine: MidiEngine) -> None:
         super().__init__()
         self.midi = midi_engine
-        self._pads: dict[str, PadWidget] = {}
         self._pad_grid: list[list[PadWidget]] = []  # 2D grid for navigation
         self._held_keys: dict[str, object] = {}  # key -> timer for release detection
+        self._trigger_releases = ReleaseQueue(self, self._trigger_release)
+        self._selected_pad: PadWidget | None = None
+        self._last_status: Optional[str] = None
+        self._status_widget: Optional[StatusBar] = None
 
     def compose(self) -> ComposeResult:
-        yield StatusBar(self._make_status())
+        self._last_status = self._make_status()
+        self._status_widget = StatusBar(self._last_status)
+        yield self._status_widget
         with MainContent():
             with GridContainer():
-                for row_idx, row in enumerate(KEY_ROWS):
+                for row_idx, row in enumerate(KEY_GRID):
                     pad_row = []
                     with PadRow():
-                        for col_idx, key in enumerate(row):
+                        for col_idx, (key, label) in enumerate(row):
                             note = self._key_to_note(row_idx, col_idx)
-                            label = KEY_LABELS[row_idx][col_idx]
                             config = PadConfig(note=note)
                             pad = PadWidget(label, config, row_idx, col_idx, id=f"pad-{key}")
-                            self._pads[key] = pad
                             pad_row.append(pad)
                             yield pad
                     self._pad_grid.append(pad_row)
@@ -1326,12 +1445,12 @@ class GridScreen(Screen):
         )
 
     def _update_status(self) -> None:
-        """Update the status bar."""
-        try:
-            status = self.query_one(StatusBar)
-            status.update(self._make_status())
-        except Exception:
-            pass
+        """Update the status bar if its content changed."""
+        content = self._make_status()
+        if content == self._last_status or self._status_widget is None:
+            return
+        self._status_widget.update(content)
+        self._last_status = content
 
     def _key_to_note(self, row: int, col: int) -> int:
         """Convert grid position to MIDI note.
@@ -1351,19 +1470,31 @@ class GridScreen(Screen):
 
     def _update_pad_notes(self) -> None:
         """Update all pad note values after octave change."""
-        for row_idx, row in enumerate(KEY_ROWS):
-            for col_idx, key in enumerate(row):
-                if key in self._pads:
-                    pad = self._pads[key]
-                    if pad.config.msg_type == "note":
-                        pad.config.note = self._key_to_note(row_idx, col_idx)
-                    pad.refresh()
+        # Same layout as _key_to_note, with the octave base computed once
+        base = (self.octave + 1) * 12
+        for row_idx, row in enumerate(self._pad_grid):
+            row_base = base + row_idx * 8
+            for col_idx, pad in enumerate(row):
+                if pad.config.msg_type != "note":
+                    continue
+                note = row_base + col_idx
+                if pad.config.note != note:
+                    pad.config.note = note
+                    pad.invalidate_render()
 
     def _update_selection(self) -> None:
         """Update pad selection visual state and side panel."""
-        for row_idx, row in enumerate(self._pad_grid):
-            for col_idx, pad in enumerate(row):
-                pad.selected = (row_idx == self.selected_row and col_idx == self.selected_col)
+        # Only the previously and newly selected pads change state
+        if self.selected_row >= 0 and self.selected_col >= 0:
+            pad = self._pad_grid[self.selected_row][self.selected_col]
+        else:
+            pad = None
+        if pad is not self._selected_pad:
+            if self._selected_pad is not None:
+                self._selected_pad.selected = False
+            if pad is not None:
+                pad.selected = True
+            self._selected_pad = pad
 
         # Update side panel
         self._update_pad_details()
@@ -1406,51 +1537,31 @@ class GridScreen(Screen):
         """React to virtual port state changes."""
         self._update_status()
 
-    def watch_selected_row(self, row: int) -> None:
-        """React to selection row changes."""
-        self._update_selection()
-        self._update_status()
+    @property
+    def selected_row(self) -> int:
+        """Row of the selected pad, -1 if none."""
+        return self.selected_pos[0]
 
-    def watch_selected_col(self, col: int) -> None:
-        """React to selection column changes."""
+    @property
+    def selected_col(self) -> int:
+        """Column of the selected pad, -1 if none."""
+        return self.selected_pos[1]
+
+    def watch_selected_pos(self, pos: tuple[int, int]) -> None:
+        """React to selection changes."""
         self._update_selection()
         self._update_status()
 
     def on_key(self, event) -> None:
         """Handle key press for grid pads."""
-        key = event.key
-
-        # Check for modifier keys in key string
-        has_shift = key.startswith("shift+")
-        has_ctrl = key.startswith("ctrl+")
-
-        # Ctrl+key is reserved for navigation, don't trigger pads
-        if has_ctrl:
+        # Check if this is a grid key (Ctrl+key never is)
+        entry = GRID_KEY_EVENTS.get(event.key)
+        if entry is None:
             return
 
-        # Extract base key
-        base_key = key
-        if has_shift:
-            base_key = key[6:]  # Remove "shift+"
-
-        # Normalize comma key
-        if base_key == ",":
-            base_key = "comma"
-
-        # Check if this is a grid key
-        grid_key = None
-        for row in KEY_ROWS:
-            if base_key in row:
-                grid_key = base_key
-                break
-
-        if grid_key is None:
-            return
-
-        if grid_key not in self._pads:
-            return
-
-        pad = self._pads[grid_key]
+        grid_key, has_shift = entry
+        row, col = KEY_TO_POS[grid_key]
+        pad = self._pad_grid[row][col]
         settings = get_settings()
 
         if settings.play_mode == "trigger":
@@ -1463,11 +1574,7 @@ class GridScreen(Screen):
             self._held_keys[grid_key] = True  # Mark as held to ignore repeats
 
             # Schedule note off after configured duration
-            duration = settings.trigger_duration_ms / 1000.0
-            self.set_timer(
-                duration,
-                lambda k=grid_key, p=pad: self._trigger_release(k, p),
-            )
+            self._trigger_releases.push(grid_key, settings.trigger_duration_ms / 1000.0)
         else:
             # Hold mode: sustain while key is held
             initial_delay = settings.hold_initial_delay_ms / 1000.0
@@ -1481,7 +1588,7 @@ class GridScreen(Screen):
                     existing_timer.stop()
                 self._held_keys[grid_key] = self.set_timer(
                     repeat_delay,
-                    lambda k=grid_key, p=pad: self._key_release_timeout(k, p),
+                    partial(self._key_release_timeout, grid_key, pad),
                 )
                 return
 
@@ -1492,14 +1599,15 @@ class GridScreen(Screen):
             # Start release detection timer with longer initial delay
             self._held_keys[grid_key] = self.set_timer(
                 initial_delay,
-                lambda k=grid_key, p=pad: self._key_release_timeout(k, p),
+                partial(self._key_release_timeout, grid_key, pad),
             )
 
-    def _trigger_release(self, grid_key: str, pad: PadWidget) -> None:
+    def _trigger_release(self, grid_key: str) -> None:
         """Called after trigger duration - release the note."""
         if grid_key in self._held_keys:
             del self._held_keys[grid_key]
-            self._release_pad(pad)
+            row, col = KEY_TO_POS[grid_key]
+            self._release_pad(self._pad_grid[row][col])
 
     def _key_release_timeout(self, grid_key: str, pad: PadWidget) -> None:
         """Called when key repeat stops (hold mode) - key was released."""
@@ -1544,42 +1652,41 @@ class GridScreen(Screen):
 
     def action_select_left(self) -> None:
         """Move selection left (wraps around)."""
-        if self.selected_row < 0:
+        row, col = self.selected_pos
+        if row < 0:
             # No selection, start at top-left
-            self.selected_row = 0
-            self.selected_col = 0
+            self.selected_pos = (0, 0)
         else:
-            self.selected_col = (self.selected_col - 1) % 8
+            self.selected_pos = (row, (col - 1) % 8)
 
     def action_select_right(self) -> None:
         """Move selection right (wraps around)."""
-        if self.selected_row < 0:
-            self.selected_row = 0
-            self.selected_col = 0
+        row, col = self.selected_pos
+        if row < 0:
+            self.selected_pos = (0, 0)
         else:
-            self.selected_col = (self.selected_col + 1) % 8
+            self.selected_pos = (row, (col + 1) % 8)
 
     def action_select_up(self) -> None:
         """Move selection up (wraps around)."""
-        if self.selected_row < 0:
-            self.selected_row = 0
-            self.selected_col = 0
+        row, col = self.selected_pos
+        if row < 0:
+            self.selected_pos = (0, 0)
         else:
-            self.selected_row = (self.selected_row - 1) % 4
+            self.selected_pos = ((row - 1) % 4, col)
 
     def action_select_down(self) -> None:
         """Move selection down (wraps around)."""
-        if self.selected_row < 0:
-            self.selected_row = 0
-            self.selected_col = 0
+        row, col = self.selected_pos
+        if row < 0:
+            self.selected_pos = (0, 0)
         else:
-            self.selected_row = (self.selected_row + 1) % 4
+            self.selected_pos = ((row + 1) % 4, col)
 
     def action_deselect_or_quit(self) -> None:
         """Deselect pad if selected, otherwise quit."""
         if self.selected_row >= 0:
-            self.selected_row = -1
-            self.selected_col = -1
+            self.selected_pos = (-1, -1)
         else:
             self.action_quit()
 
@@ -1594,7 +1701,7 @@ class GridScreen(Screen):
         def handle_config(new_config: PadConfig | None) -> None:
             if new_config:
                 pad.config = new_config
-                pad.refresh()
+                pad.invalidate_render()
                 self._update_status()
 
         self.app.push_screen(PadEditorScreen(pad), handle_config)
@@ -1620,6 +1727,7 @@ class GridScreen(Screen):
                 outputs,
                 self.midi_output or None,
                 self.is_virtual_port,
+                self.midi.virtual_port_name,
             ),
             handle_output,
         )
@@ -1638,12 +1746,11 @@ class GridScreen(Screen):
 
     def action_select_theme(self) -> None:
         """Open theme picker."""
-        config_path = get_config_path("gridcat")
 
         def handle_theme(theme: str | None) -> None:
             if theme:
                 self.app.theme = theme
-                set_theme(theme, config_path)
+                set_theme(theme, self.app.config_path)
 
         self.app.push_screen(ThemePickerScreen(self.app.theme), handle_theme)
 
@@ -1715,9 +1822,14 @@ class KeyboardScreen(Screen):
         self.midi = midi_engine
         self._keys: dict[str, PianoKey] = {}
         self._held_keys: dict[str, object] = {}
+        self._trigger_releases = ReleaseQueue(self, self._trigger_release)
+        self._last_status: Optional[str] = None
+        self._status_widget: Optional[StatusBar] = None
 
     def compose(self) -> ComposeResult:
-        yield StatusBar(self._make_status())
+        self._last_status = self._make_status()
+        self._status_widget = StatusBar(self._last_status)
+        yield self._status_widget
         with MainContent():
             with KeyboardContainer():
                 # Upper section (number row = black, QWERTY row = white) - lower notes
@@ -1834,11 +1946,11 @@ class KeyboardScreen(Screen):
         )
 
     def _update_status(self) -> None:
-        try:
-            status = self.query_one(StatusBar)
-            status.update(self._make_status())
-        except Exception:
-            pass
+        content = self._make_status()
+        if content == self._last_status or self._status_widget is None:
+            return
+        self._status_widget.update(content)
+        self._last_status = content
 
     def _offset_to_note(self, offset: int) -> int:
         """Convert semitone offset to MIDI note."""
@@ -1874,25 +1986,11 @@ class KeyboardScreen(Screen):
 
     def on_key(self, event) -> None:
         """Handle key press for piano keys."""
-        key = event.key
-
-        has_shift = key.startswith("shift+")
-        has_ctrl = key.startswith("ctrl+")
-
-        if has_ctrl:
-            return
-
-        base_key = key
-        if has_shift:
-            base_key = key[6:]
-
-        # Normalize special keys
-        if base_key == ",":
-            base_key = "comma"
-
-        if base_key not in PIANO_KEY_MAP:
+        entry = PIANO_KEY_EVENTS.get(event.key)
+        if entry is None:
             return
 
+        base_key, has_shift = entry
         if base_key not in self._keys:
             return
 
@@ -1907,11 +2005,7 @@ class KeyboardScreen(Screen):
             self._press_key(piano_key, velocity)
             self._held_keys[base_key] = True
 
-            duration = settings.trigger_duration_ms / 1000.0
-            self.set_timer(
-                duration,
-                lambda k=base_key, p=piano_key: self._trigger_release(k, p),
-            )
+            self._trigger_releases.push(base_key, settings.trigger_duration_ms / 1000.0)
         else:
             initial_delay = settings.hold_initial_delay_ms / 1000.0
             repeat_delay = settings.hold_repeat_delay_ms / 1000.0
@@ -1922,7 +2016,7 @@ class KeyboardScreen(Screen):
                     existing_timer.stop()
                 self._held_keys[base_key] = self.set_timer(
                     repeat_delay,
-                    lambda k=base_key, p=piano_key: self._key_release_timeout(k, p),
+                    partial(self._key_release_timeout, base_key, piano_key),
                 )
                 return
 
@@ -1931,7 +2025,7 @@ class KeyboardScreen(Screen):
 
             self._held_keys[base_key] = self.set_timer(
                 initial_delay,
-                lambda k=base_key, p=piano_key: self._key_release_timeout(k, p),
+                partial(self._key_release_timeout, base_key, piano_key),
             )
 
     def _press_key(self, piano_key: PianoKey, velocity: int = 100) -> None:
@@ -1946,10 +2040,10 @@ class KeyboardScreen(Screen):
         self.midi.note_off(piano_key.note)
         self._log_midi(f"Note Off {note_to_name(piano_key.note)}", piano_key.key_label)
 
-    def _trigger_release(self, base_key: str, piano_key: PianoKey) -> None:
+    def _trigger_release(self, base_key: str) -> None:
         if base_key in self._held_keys:
             del self._held_keys[base_key]
-            self._release_key(piano_key)
+            self._release_key(self._keys[base_key])
 
     def _key_release_timeout(self, base_key: str, piano_key: PianoKey) -> None:
         if base_key in self._held_keys:
@@ -1984,7 +2078,12 @@ class KeyboardScreen(Screen):
                         self.is_virtual_port = False
 
         self.app.push_screen(
-            OutputPickerScreen(outputs, self.midi_output or None, self.is_virtual_port),
+            OutputPickerScreen(
+                outputs,
+                self.midi_output or None,
+                self.is_virtual_port,
+                self.midi.virtual_port_name,
+            ),
             handle_output,
         )
 
@@ -1997,12 +2096,10 @@ class KeyboardScreen(Screen):
         self.app.push_screen(ChannelPickerScreen(self.midi_channel), handle_channel)
 
     def action_select_theme(self) -> None:
-        config_path = get_config_path("gridcat")
-
         def handle_theme(theme: str | None) -> None:
             if theme:
                 self.app.theme = theme
-                set_theme(theme, config_path)
+                set_theme(theme, self.app.config_path)
 
         self.app.push_screen(ThemePickerScreen(self.app.theme), handle_theme)
 
@@ -2092,16 +2189,16 @@ class GridcatApp(App):
         Binding("ctrl+c", "quit", "Quit", show=False),
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, port_name: str = DEFAULT_PORT_NAME) -> None:
         super().__init__()
-        self.midi = MidiEngine()
+        self.midi = MidiEngine(virtual_port_name=port_name)
         self.current_view = "grid"  # "grid" or "keyboard"
+        self.config_path = get_config_path("gridcat")
         register_themes(self)
 
     def on_mount(self) -> None:
         """Load theme and push initial screen on mount."""
-        config_path = get_config_path("gridcat")
-        theme = get_theme(config_path)
+        theme = get_theme(self.config_path)
         self.theme = theme
 
         # Load saved view preference
@@ -2120,7 +2217,7 @@ class GridcatApp(App):
 
     def _open_virtual_port(self) -> None:
         """Open virtual MIDI port on startup."""
-        if self.midi.open_virtual(DEFAULT_PORT_NAME):
+        if self.midi.open_virtual():
             self._update_screen_midi_state()
 
     def _update_screen_midi_state(self) -> None:
@@ -1,14 +1,108 @@
 """Audio analysis modules."""
 
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
+from google import genai
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from threadpoolctl import threadpool_limits
 
 from loopcat.database import Database
-from loopcat.analyzer.gemini import analyze_patch_with_gemini
-from loopcat.analyzer.local import detect_bpm, detect_key
+from loopcat.models import Patch
+from loopcat.analyzer.gemini import (
+    UPLOAD_WORKERS,
+    analyze_patch_with_gemini,
+    create_gemini_client,
+    delete_upload_when_done,
+    load_cached_analysis,
+    patch_content_hash,
+    upload_mp3,
+)
+from loopcat.analyzer.local import analyze_local
+
+
+# Patches analyzed at once; each spends most of its time waiting on Gemini
+PATCH_WORKERS = 4
+
+
+def _init_analysis_worker() -> None:
+    """Keep each analysis process to one native thread.
+
+    Tracks already run in parallel across processes, so letting BLAS and
+    OpenMP in every worker spin up a thread per core only oversubscribes.
+    numpy is already loaded by the time this runs, so its thread pools are
+    capped directly; the environment covers libraries loaded later.
+    """
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = "1"
+    threadpool_limits(limits=1)
+
+
+def _analyze_patch(
+    patch: Patch,
+    db: Database,
+    db_lock: threading.Lock,
+    client: genai.Client,
+    executor: ProcessPoolExecutor,
+    uploader: ThreadPoolExecutor,
+) -> None:
+    """Run local and Gemini analysis for one patch and store the results.
+
+    Several patches run at once, so database writes go through db_lock.
+    """
+    # Read the MP3s once, concurrently; the same bytes are hashed for the
+    # response cache and uploaded
+    mp3_paths = [(t.track_number, Path(t.mp3_path)) for t in patch.tracks]
+    mp3_data = list(zip(
+        [num for num, _ in mp3_paths],
+        uploader.map(Path.read_bytes, [mp3_path for _, mp3_path in mp3_paths]),
+    ))
+
+    # Reuse a cached Gemini analysis of identical audio, otherwise upload
+    # the MP3s in the background while librosa runs
+    content_hash = patch_content_hash(mp3_data)
+    cached = load_cached_analysis(content_hash)
+    upload_futures = []
+    if cached is None:
+        upload_futures = [
+            (num, uploader.submit(upload_mp3, client, data, mp3_path.name))
+            for (num, data), (_, mp3_path) in zip(mp3_data, mp3_paths)
+        ]
+
+    # Whatever happens from here on, remove the uploads from Gemini
+    try:
+        # Run local analysis on all tracks in parallel, reading the MP3s (a
+        # tenth the size of the WAVs, and decoded to 22.05 kHz mono regardless)
+        results = list(executor.map(
+            analyze_local,
+            [mp3_path for _, mp3_path in mp3_paths],
+        ))
+
+        # Run Gemini analysis on all tracks together
+        if cached is not None:
+            patch_analysis, track_analyses = cached
+        else:
+            uploaded_files = [(num, future.result()) for num, future in upload_futures]
+            patch_analysis, track_analyses = analyze_patch_with_gemini(
+                client, uploaded_files, content_hash=content_hash
+            )
+    finally:
+        for _, future in upload_futures:
+            delete_upload_when_done(client, future)
+
+    # Update database in one transaction
+    with db_lock, db.transaction():
+        for track, (bpm, key) in zip(patch.tracks, results):
+            db.update_track_local_analysis(track.id, bpm, key)
+        db.update_patch_analysis(patch.id, patch_analysis)
+        for track in patch.tracks:
+            if track.track_number in track_analyses:
+                db.update_track_analysis(track.id, track_analyses[track.track_number])
 
 
 def analyze_patches(
@@ -45,57 +139,52 @@ def analyze_patches(
         console.print("[yellow]No patches need analysis.[/yellow]")
         return
 
+    try:
+        client = create_gemini_client()
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        return
+
     console.print(f"Analyzing [cyan]{len(patches)}[/cyan] patch(es)...")
 
     analyzed_count = 0
     error_count = 0
+    db_lock = threading.Lock()
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
-    ) as progress:
+        refresh_per_second=10,
+    ) as progress, ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        # Workers start lazily from patch threads while upload and Progress
+        # threads are running; forking then can deadlock, so spawn instead
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_analysis_worker,
+    ) as executor, ThreadPoolExecutor(
+        max_workers=UPLOAD_WORKERS,
+    ) as uploader, ThreadPoolExecutor(
+        max_workers=PATCH_WORKERS,
+    ) as patch_pool:
         task = progress.add_task("Analyzing...", total=len(patches))
 
-        for patch in patches:
-            progress.update(task, description=f"Patch #{patch.catalog_number}")
-
+        futures = {
+            patch_pool.submit(_analyze_patch, patch, db, db_lock, client, executor, uploader): patch
+            for patch in patches
+        }
+        for future in as_completed(futures):
+            patch = futures[future]
             try:
-                # Run local analysis on each track
-                for track in patch.tracks:
-                    audio_path = Path(track.wav_path)
-
-                    progress.update(
-                        task,
-                        description=f"#{patch.catalog_number} track {track.track_number} (BPM/key)",
-                    )
-
-                    bpm = detect_bpm(audio_path)
-                    key = detect_key(audio_path)
-                    db.update_track_local_analysis(track.id, bpm, key)
-
-                # Run Gemini analysis on all tracks together
-                progress.update(
-                    task,
-                    description=f"#{patch.catalog_number} (Gemini)",
-                )
-
-                mp3_paths = [(t.track_number, Path(t.mp3_path)) for t in patch.tracks]
-                patch_analysis, track_analyses = analyze_patch_with_gemini(mp3_paths)
-
-                # Update database
-                db.update_patch_analysis(patch.id, patch_analysis)
-                for track in patch.tracks:
-                    if track.track_number in track_analyses:
-                        db.update_track_analysis(track.id, track_analyses[track.track_number])
-
+                future.result()
                 analyzed_count += 1
-
             except Exception as e:
                 console.print(f"[red]Error analyzing patch #{patch.catalog_number}:[/red] {e}")
                 error_count += 1
 
-            progress.advance(task)
+            # One task update per finished patch; Progress redraws on its
+            # own refresh timer rather than on every update
+            progress.update(task, description=f"Patch #{patch.catalog_number}", advance=1)
 
     console.print()
     console.print(f"[green]Analyzed:[/green] {analyzed_count} patch(es)")
@@ -1,14 +1,68 @@
 """Gemini-based audio analysis."""
 
+import hashlib
+import io
 import json
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Optional
 
 from google import genai
 from google.genai import types
 
-from loopcat.config import get_gemini_api_key
+from pydantic import BaseModel, Field, ValidationError
+
+from loopcat.config import DEFAULT_GEMINI_CACHE_DIR, get_gemini_api_key
 from loopcat.models import PatchAnalysis, TrackAnalysis
 
+# Gemini model used for patch analysis
+DEFAULT_MODEL = "gemini-2.0-flash"
+
+# Bump when the response schema or its parsing changes, so older cached
+# responses are no longer used
+CACHE_VERSION = 1
+
+# Concurrent file uploads/deletes; each is a latency-bound HTTP round trip
+UPLOAD_WORKERS = 8
+
+# Deletes uploaded files once their patch is done with them. Its threads are
+# joined at interpreter exit, so pending deletes still finish.
+_cleanup_executor = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS, thread_name_prefix="gemini-cleanup")
+
+
+class _TrackResponse(BaseModel):
+    """Track entry of the JSON schema Gemini is asked to answer with."""
+
+    track_number: int
+    suggested_name: str
+    role: str
+    instruments: list[str]
+    description: str
+    energy_level: int = Field(ge=1, le=10)
+
+
+class _PatchResponse(BaseModel):
+    """Patch entry of the JSON schema Gemini is asked to answer with."""
+
+    suggested_name: str
+    description: str
+    mood: list[str]
+    musical_style: str
+    energy_level: int = Field(ge=1, le=10)
+    tags: list[str]
+    use_case: Optional[str] = None
+
+
+class _AnalysisResponse(BaseModel):
+    """JSON schema Gemini is asked to answer with."""
+
+    patch: _PatchResponse
+    tracks: list[_TrackResponse]
+
+
 # Analysis prompt template
 ANALYSIS_PROMPT = """You are analyzing audio loops from a Boss RC-300 looper pedal.
 I'm uploading {track_count} track(s) that belong to the same patch (recorded together as a musical unit).
@@ -58,69 +112,75 @@ The tracks array should have one entry per track, in order (track 1, track 2, tr
 """
 
 
-def analyze_patch_with_gemini(
-    mp3_paths: list[tuple[int, Path]],
-    model_name: str = "gemini-2.0-flash",
-) -> tuple[PatchAnalysis, dict[int, TrackAnalysis]]:
-    """Analyze a patch using Gemini.
+@lru_cache(maxsize=None)
+def _analysis_prompt(track_count: int) -> str:
+    """Analysis prompt for a patch with the given number of tracks."""
+    return ANALYSIS_PROMPT.format(track_count=track_count)
 
-    Args:
-        mp3_paths: List of (track_number, mp3_path) tuples.
-        model_name: Gemini model to use.
 
-    Returns:
-        Tuple of (PatchAnalysis, dict mapping track_number to TrackAnalysis).
+def _delete_uploaded(client: genai.Client, uploaded: types.File) -> None:
+    """Delete an uploaded file from Gemini, ignoring failures."""
+    try:
+        client.files.delete(name=uploaded.name)
+    except Exception:
+        pass  # Ignore cleanup errors
 
-    Raises:
-        ValueError: If GOOGLE_API_KEY is not set.
-        Exception: If Gemini API call fails.
+
+def _queue_delete(client: genai.Client, future: Future) -> None:
+    """Queue deletion of a finished upload, if it succeeded."""
+    if not future.cancelled() and future.exception() is None:
+        _cleanup_executor.submit(_delete_uploaded, client, future.result())
+
+
+def delete_upload_when_done(client: genai.Client, future: Future) -> None:
+    """Delete a file from Gemini in the background once its upload finishes.
+
+    Nothing waits on the delete, and failed uploads are skipped.
+
+    Args:
+        client: Gemini client the file is being uploaded with.
+        future: Future of the upload, resolving to the uploaded file.
     """
-    api_key = get_gemini_api_key()
-    if not api_key:
-        raise ValueError("Gemini API key not configured. Run 'loopcat auth' to set it.")
+    future.add_done_callback(partial(_queue_delete, client))
 
-    client = genai.Client(api_key=api_key)
 
-    # Upload audio files
-    uploaded_files = []
-    for track_num, mp3_path in sorted(mp3_paths):
-        uploaded = client.files.upload(file=mp3_path)
-        uploaded_files.append((track_num, uploaded))
+def _analysis_from_response(
+    raw_response: str, response: _AnalysisResponse
+) -> tuple[PatchAnalysis, dict[int, TrackAnalysis]]:
+    """Build patch and track analyses from a schema-conforming response."""
+    patch_analysis = PatchAnalysis(raw_response=raw_response, **response.patch.model_dump())
+    track_analyses = {
+        track.track_number: TrackAnalysis(**track.model_dump(exclude={"track_number"}))
+        for track in response.tracks
+    }
+    return patch_analysis, track_analyses
 
-    # Build the prompt
-    prompt = ANALYSIS_PROMPT.format(track_count=len(mp3_paths))
 
-    # Build content with audio files
-    contents = []
-    for track_num, uploaded in uploaded_files:
-        contents.append(
-            types.Content(
-                role="user",
-                parts=[
-                    types.Part(text=f"Track {track_num}:"),
-                    types.Part.from_uri(file_uri=uploaded.uri, mime_type=uploaded.mime_type),
-                ],
-            )
-        )
+def _energy_level(value: object) -> int:
+    """Coerce a response energy level into the 1-10 range, defaulting to 5."""
+    try:
+        return min(max(int(value), 1), 10)
+    except (TypeError, ValueError):
+        return 5
 
-    contents.append(
-        types.Content(
-            role="user",
-            parts=[types.Part(text=prompt)],
-        )
-    )
 
-    # Call Gemini
-    response = client.models.generate_content(
-        model=model_name,
-        contents=contents,
-        config=types.GenerateContentConfig(
-            temperature=0.7,
-            response_mime_type="application/json",
-        ),
-    )
+def _parse_analysis(raw_response: str) -> tuple[PatchAnalysis, dict[int, TrackAnalysis]]:
+    """Parse a Gemini JSON response into patch and track analyses.
 
-    raw_response = response.text
+    Responses matching the schema are validated in a single pass; anything
+    else (e.g. cached from before the schema was enforced, or with an
+    energy level out of range) goes through the lenient field-by-field parse
+    below, which fills in defaults and clamps energy levels to 1-10.
+
+    Raises:
+        ValueError: If the response is not the expected JSON shape.
+    """
+    try:
+        return _analysis_from_response(
+            raw_response, _AnalysisResponse.model_validate_json(raw_response)
+        )
+    except ValidationError:
+        pass
 
     # Parse JSON response
     try:
@@ -146,7 +206,7 @@ def analyze_patch_with_gemini(
         description=patch_data.get("description", ""),
         mood=patch_data.get("mood", []),
         musical_style=patch_data.get("musical_style", ""),
-        energy_level=patch_data.get("energy_level", 5),
+        energy_level=_energy_level(patch_data.get("energy_level")),
         tags=patch_data.get("tags", []),
         use_case=patch_data.get("use_case"),
     )
@@ -160,14 +220,171 @@ def analyze_patch_with_gemini(
             role=track_data.get("role", ""),
             instruments=track_data.get("instruments", []),
             description=track_data.get("description", ""),
-            energy_level=track_data.get("energy_level", 5),
+            energy_level=_energy_level(track_data.get("energy_level")),
         )
 
-    # Clean up uploaded files
-    for _, uploaded in uploaded_files:
+    return patch_analysis, track_analyses
+
+
+def patch_content_hash(mp3_data: list[tuple[int, bytes]], model_name: str = DEFAULT_MODEL) -> str:
+    """Hash a patch's MP3s, in track order, for the Gemini response cache.
+
+    The model name, analysis prompt and CACHE_VERSION are hashed along with
+    the audio, so changing any of them misses responses cached before.
+
+    Args:
+        mp3_data: List of (track_number, mp3 file contents) tuples.
+        model_name: Gemini model the analysis is run with.
+
+    Returns:
+        Hex digest identifying the analysis of the patch's audio.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{CACHE_VERSION}\n{model_name}\n{ANALYSIS_PROMPT}\n".encode())
+    for track_num, data in sorted(mp3_data):
+        digest.update(f"track {track_num}\n".encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def upload_mp3(client: genai.Client, data: bytes, display_name: str) -> types.File:
+    """Upload MP3 contents that were already read into memory.
+
+    Args:
+        client: Gemini client to upload with.
+        data: MP3 file contents.
+        display_name: Name shown for the file in Gemini.
+
+    Returns:
+        The uploaded file handle.
+    """
+    return client.files.upload(
+        file=io.BytesIO(data),
+        config=types.UploadFileConfig(mime_type="audio/mpeg", display_name=display_name),
+    )
+
+
+def load_cached_analysis(
+    content_hash: str,
+    cache_dir: Path = DEFAULT_GEMINI_CACHE_DIR,
+) -> Optional[tuple[PatchAnalysis, dict[int, TrackAnalysis]]]:
+    """Load a previously cached Gemini analysis for the given audio.
+
+    Args:
+        content_hash: Hash from patch_content_hash().
+        cache_dir: Directory holding cached responses.
+
+    Returns:
+        Tuple of (PatchAnalysis, dict mapping track_number to TrackAnalysis),
+        or None if nothing usable is cached.
+    """
+    try:
+        raw_response = (cache_dir / f"{content_hash}.json").read_text()
+        return _parse_analysis(raw_response)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_response(content_hash: str, raw_response: str, cache_dir: Path) -> None:
+    """Atomically write a raw Gemini response into the cache."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
         try:
-            client.files.delete(name=uploaded.name)
-        except Exception:
-            pass  # Ignore cleanup errors
+            with os.fdopen(fd, "w") as f:
+                f.write(raw_response)
+            os.replace(tmp_path, cache_dir / f"{content_hash}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass  # Caching is best effort
+
+
+def create_gemini_client() -> genai.Client:
+    """Create a Gemini client from the configured API key.
+
+    Raises:
+        ValueError: If the Gemini API key is not configured.
+    """
+    api_key = get_gemini_api_key()
+    if not api_key:
+        raise ValueError("Gemini API key not configured. Run 'loopcat auth' to set it.")
+
+    return genai.Client(api_key=api_key)
+
+
+def analyze_patch_with_gemini(
+    client: genai.Client,
+    uploaded_files: list[tuple[int, types.File]],
+    model_name: str = DEFAULT_MODEL,
+    content_hash: Optional[str] = None,
+    cache_dir: Path = DEFAULT_GEMINI_CACHE_DIR,
+) -> tuple[PatchAnalysis, dict[int, TrackAnalysis]]:
+    """Analyze a patch using Gemini.
+
+    The uploaded files are left in place; callers delete them with
+    delete_upload_when_done() whether or not the analysis succeeds.
+
+    Args:
+        client: Gemini client the files were uploaded with.
+        uploaded_files: List of (track_number, uploaded file) tuples.
+        model_name: Gemini model to use.
+        content_hash: If given, cache the response under this hash (see
+            patch_content_hash()) for load_cached_analysis().
+        cache_dir: Directory holding cached responses.
+
+    Returns:
+        Tuple of (PatchAnalysis, dict mapping track_number to TrackAnalysis).
+
+    Raises:
+        Exception: If Gemini API call fails.
+    """
+    uploaded_files = sorted(uploaded_files, key=lambda item: item[0])
+
+    # Build the prompt
+    prompt = _analysis_prompt(len(uploaded_files))
+
+    # Build content with audio files
+    contents = []
+    for track_num, uploaded in uploaded_files:
+        contents.append(
+            types.Content(
+                role="user",
+                parts=[
+                    types.Part(text=f"Track {track_num}:"),
+                    types.Part.from_uri(file_uri=uploaded.uri, mime_type=uploaded.mime_type),
+                ],
+            )
+        )
+
+    contents.append(
+        types.Content(
+            role="user",
+            parts=[types.Part(text=prompt)],
+        )
+    )
+
+    # Call Gemini
+    response = client.models.generate_content(
+        model=model_name,
+        contents=contents,
+        config=types.GenerateContentConfig(
+            temperature=0.7,
+            response_mime_type="application/json",
+            response_schema=_AnalysisResponse,
+        ),
+    )
+
+    raw_response = response.text
+    try:
+        if not isinstance(response.parsed, _AnalysisResponse):
+            raise ValueError("Response did not match the schema")
+        patch_analysis, track_analyses = _analysis_from_response(raw_response, response.parsed)
+    except ValueError:
+        patch_analysis, track_analyses = _parse_analysis(raw_response)
+
+    if content_hash is not None:
+        _store_cached_response(content_hash, raw_response, cache_dir)
 
     return patch_analysis, track_analyses
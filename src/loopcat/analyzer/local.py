@@ -7,6 +7,109 @@ import librosa
 import numpy as np
 
 
+# Beat tracking and chroma only need content well below 11 kHz, so analysis
+# runs on mono audio at half the usual 44.1 kHz rate.
+ANALYSIS_SAMPLE_RATE = 22050
+
+# Half of librosa's default hop, keeping the ~11.6 ms onset frames that beat
+# tracking had on 44.1 kHz input; the coarser default grid skews tempo.
+BEAT_HOP_LENGTH = 256
+
+# Leading/trailing audio quieter than this (dB below peak) is silence and
+# is trimmed before tempo estimation.
+TRIM_TOP_DB = 30
+
+# Tracks quieter than this RMS (about -80 dBFS) or shorter than this many
+# seconds have no usable tempo or key, so analysis skips them.
+SILENCE_RMS = 1e-4
+MIN_ANALYSIS_SECONDS = 1.0
+
+# Key detection only uses the time-averaged chroma, so an STFT with long
+# frames and a coarse hop is enough (~186 ms windows at 22.05 kHz).
+CHROMA_N_FFT = 4096
+CHROMA_HOP_LENGTH = 2048
+
+
+# Key names
+KEY_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+KEY_MODES = ["major", "minor"]
+
+
+def _profile_rotations(profile: list[float]) -> np.ndarray:
+    """All 12 rotations of a key profile, each centered and unit-length."""
+    centered = np.array(profile) - np.mean(profile)
+    centered /= np.linalg.norm(centered)
+    return np.stack([np.roll(centered, i) for i in range(12)])
+
+
+# Major and minor profiles (Krumhansl-Schmuckler), interleaved by root so
+# row 2*i is the major key on KEY_NAMES[i] and row 2*i + 1 its minor
+KEY_PROFILES = np.stack(
+    [
+        _profile_rotations([6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88]),
+        _profile_rotations([6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17]),
+    ],
+    axis=1,
+).reshape(24, 12)
+
+
+def _load(audio_path: Path) -> tuple[np.ndarray, float]:
+    """Decode an audio file into mono samples at the analysis rate."""
+    return librosa.load(audio_path, sr=ANALYSIS_SAMPLE_RATE, mono=True)
+
+
+def _is_analyzable(y: np.ndarray, sr: float) -> bool:
+    """Whether decoded audio is long and loud enough to analyze."""
+    if len(y) < MIN_ANALYSIS_SECONDS * sr:
+        return False
+    rms = float(np.sqrt(np.dot(y, y) / len(y)))
+    return rms >= SILENCE_RMS
+
+
+def _bpm_from_audio(y: np.ndarray, sr: float) -> Optional[float]:
+    """Detect BPM from decoded audio, or None if detection fails."""
+    try:
+        # Only the tempo is needed, so estimate it straight from the onset
+        # envelope (as beat_track does) and skip placing individual beats
+        y, _ = librosa.effects.trim(y, top_db=TRIM_TOP_DB)
+        onset_env = librosa.onset.onset_strength(
+            y=y, sr=sr, hop_length=BEAT_HOP_LENGTH, aggregate=np.median
+        )
+        if not onset_env.any():
+            return None
+        tempo = librosa.feature.tempo(onset_envelope=onset_env, sr=sr, hop_length=BEAT_HOP_LENGTH)
+        # tempo can be an array, get scalar value
+        if isinstance(tempo, np.ndarray):
+            tempo = float(tempo[0]) if len(tempo) > 0 else None
+        return float(tempo) if tempo else None
+    except Exception:
+        return None
+
+
+def _key_from_audio(y: np.ndarray, sr: float) -> Optional[str]:
+    """Detect musical key from decoded audio, or None if detection fails."""
+    try:
+        # Compute chroma features
+        chroma = librosa.feature.chroma_stft(
+            y=y, sr=sr, n_fft=CHROMA_N_FFT, hop_length=CHROMA_HOP_LENGTH
+        )
+
+        # Average chroma across time
+        chroma_avg = np.mean(chroma, axis=1)
+
+        # Correlation with every (root, mode) pair at once, ordered C major,
+        # C minor, C# major, ... so argmax keeps the first best match. The
+        # profile rows are zero-mean and unit-length, so the dot product is
+        # the Pearson correlation up to a positive factor shared by all 24
+        # keys; centering or normalizing the chroma would not change argmax.
+        corrs = KEY_PROFILES @ chroma_avg
+        best = int(np.argmax(corrs))
+        root, mode = divmod(best, 2)
+        return f"{KEY_NAMES[root]} {KEY_MODES[mode]}"
+    except Exception:
+        return None
+
+
 def detect_bpm(audio_path: Path) -> Optional[float]:
     """Detect BPM of an audio file.
 
@@ -17,14 +120,12 @@ def detect_bpm(audio_path: Path) -> Optional[float]:
         Detected BPM, or None if detection fails.
     """
     try:
-        y, sr = librosa.load(audio_path, sr=None)
-        tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
-        # tempo can be an array, get scalar value
-        if isinstance(tempo, np.ndarray):
-            tempo = float(tempo[0]) if len(tempo) > 0 else None
-        return float(tempo) if tempo else None
+        y, sr = _load(audio_path)
     except Exception:
         return None
+    if not _is_analyzable(y, sr):
+        return None
+    return _bpm_from_audio(y, sr)
 
 
 def detect_key(audio_path: Path) -> Optional[str]:
@@ -39,47 +140,27 @@ def detect_key(audio_path: Path) -> Optional[str]:
         Detected key (e.g., "C major", "A minor"), or None if detection fails.
     """
     try:
-        y, sr = librosa.load(audio_path, sr=None)
-
-        # Compute chroma features
-        chroma = librosa.feature.chroma_cqt(y=y, sr=sr)
-
-        # Average chroma across time
-        chroma_avg = np.mean(chroma, axis=1)
-
-        # Key names
-        key_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-
-        # Major and minor profiles (Krumhansl-Schmuckler)
-        major_profile = np.array([6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88])
-        minor_profile = np.array([6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17])
-
-        # Normalize profiles
-        major_profile = major_profile / np.linalg.norm(major_profile)
-        minor_profile = minor_profile / np.linalg.norm(minor_profile)
-        chroma_norm = chroma_avg / np.linalg.norm(chroma_avg)
-
-        # Correlate with all rotations of major/minor profiles
-        best_corr = -1
-        best_key = "C major"
-
-        for i in range(12):
-            # Rotate profiles
-            maj_rot = np.roll(major_profile, i)
-            min_rot = np.roll(minor_profile, i)
+        y, sr = _load(audio_path)
+    except Exception:
+        return None
+    if not _is_analyzable(y, sr):
+        return None
+    return _key_from_audio(y, sr)
 
-            # Compute correlations
-            maj_corr = np.corrcoef(chroma_norm, maj_rot)[0, 1]
-            min_corr = np.corrcoef(chroma_norm, min_rot)[0, 1]
 
-            if maj_corr > best_corr:
-                best_corr = maj_corr
-                best_key = f"{key_names[i]} major"
+def analyze_local(audio_path: Path) -> tuple[Optional[float], Optional[str]]:
+    """Detect BPM and key of an audio file, decoding it only once.
 
-            if min_corr > best_corr:
-                best_corr = min_corr
-                best_key = f"{key_names[i]} minor"
+    Args:
+        audio_path: Path to the audio file (WAV or MP3).
 
-        return best_key
+    Returns:
+        Tuple of (bpm, key); either is None if its detection fails.
+    """
+    try:
+        y, sr = _load(audio_path)
     except Exception:
-        return None
+        return None, None
+    if not _is_analyzable(y, sr):
+        return None, None
+    return _bpm_from_audio(y, sr), _key_from_audio(y, sr)
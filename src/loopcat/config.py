@@ -29,11 +29,23 @@ def get_data_dir() -> Path:
     return Path.home() / ".local" / "share" / "loopcat"
 
 
+def get_cache_dir() -> Path:
+    """Get the cache directory following XDG standard.
+
+    Uses $XDG_CACHE_HOME/loopcat if set, otherwise ~/.cache/loopcat.
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache:
+        return Path(xdg_cache) / "loopcat"
+    return Path.home() / ".cache" / "loopcat"
+
+
 DEFAULT_CONFIG_PATH = get_config_dir() / "config.yaml"
 DEFAULT_DATA_DIR = get_data_dir()
 DEFAULT_DB_PATH = DEFAULT_DATA_DIR / "catalog.db"
 DEFAULT_WAV_DIR = DEFAULT_DATA_DIR / "wav"
 DEFAULT_MP3_DIR = DEFAULT_DATA_DIR / "mp3"
+DEFAULT_GEMINI_CACHE_DIR = get_cache_dir() / "gemini"
 
 
 def load_config(config_path: Path = DEFAULT_CONFIG_PATH) -> dict:
@@ -2,6 +2,7 @@
 
 import json
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -118,24 +119,58 @@ class Database:
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Connection of the transaction() open on each thread, if any
+        self._local = threading.local()
         self._init_db()
 
     def _init_db(self) -> None:
         """Initialize database schema."""
         with self._connect() as conn:
+            # WAL commits append to a log instead of rewriting pages, and
+            # readers no longer block the writer
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript(SCHEMA)
 
     @contextmanager
     def _connect(self):
-        """Context manager for database connections."""
+        """Context manager for database connections.
+
+        Inside transaction() this yields the transaction's connection and
+        leaves committing to it.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # With WAL, NORMAL only syncs at checkpoints and stays consistent
+        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
             conn.commit()
         finally:
             conn.close()
 
+    @contextmanager
+    def transaction(self):
+        """Run the database calls in the block as a single transaction.
+
+        Everything is committed together when the block exits, or rolled
+        back if it raises. Nested transactions join the outer one.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+
+        with self._connect() as conn:
+            self._local.conn = conn
+            try:
+                yield
+            finally:
+                self._local.conn = None
+
     def get_next_catalog_number(self) -> int:
         """Get the next available catalog number."""
         with self._connect() as conn:
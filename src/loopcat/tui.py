@@ -221,8 +221,10 @@ class PatchPickerScreen(Screen):
         if option_list.highlighted is None:
             option_list.highlighted = 0
         else:
-            new_idx = option_list.highlighted + delta
-            option_list.highlighted = max(0, min(new_idx, option_list.option_count - 1))
+            new_idx = max(0, min(option_list.highlighted + delta, option_list.option_count - 1))
+            # Holding an arrow at either end of the list is a no-op
+            if new_idx != option_list.highlighted:
+                option_list.highlighted = new_idx
 
     def action_cursor_down(self) -> None:
         self._move_highlight(1)
@@ -0,0 +1,345 @@
+"""Tests for local audio analysis and the patch analysis pipeline."""
+
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from types import SimpleNamespace
+
+import librosa
+import numpy as np
+import pytest
+import soundfile as sf
+from rich.console import Console
+
+import loopcat.analyzer as analyzer
+from loopcat.analyzer import gemini
+from loopcat.analyzer.gemini import _store_cached_response, patch_content_hash
+from loopcat.analyzer.local import (
+    ANALYSIS_SAMPLE_RATE,
+    KEY_MODES,
+    KEY_NAMES,
+    KEY_PROFILES,
+    MIN_ANALYSIS_SECONDS,
+    analyze_local,
+)
+from loopcat.database import Database
+
+SR = ANALYSIS_SAMPLE_RATE
+
+MAJOR_PROFILE = [6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88]
+MINOR_PROFILE = [6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17]
+
+
+def write_wav(path, y):
+    """Write mono float samples at the analysis rate and return the path."""
+    sf.write(path, np.asarray(y, dtype=np.float32), SR)
+    return path
+
+
+def chord_progression(chords, seconds_per_chord=1.0):
+    """Sine-tone chords (lists of MIDI notes) played one after another."""
+    t = np.arange(int(seconds_per_chord * SR)) / SR
+    return np.concatenate([
+        sum(np.sin(2 * np.pi * librosa.midi_to_hz(note) * t) for note in chord) / 6
+        for chord in chords
+    ])
+
+
+def correlation_loop_key(chroma_avg):
+    """Key chosen by the original per-rotation np.corrcoef loop."""
+    major = np.array(MAJOR_PROFILE) / np.linalg.norm(MAJOR_PROFILE)
+    minor = np.array(MINOR_PROFILE) / np.linalg.norm(MINOR_PROFILE)
+    chroma_norm = chroma_avg / np.linalg.norm(chroma_avg)
+
+    best_corr = -1
+    best_key = "C major"
+    for i in range(12):
+        maj_corr = np.corrcoef(chroma_norm, np.roll(major, i))[0, 1]
+        min_corr = np.corrcoef(chroma_norm, np.roll(minor, i))[0, 1]
+        if maj_corr > best_corr:
+            best_corr = maj_corr
+            best_key = f"{KEY_NAMES[i]} major"
+        if min_corr > best_corr:
+            best_corr = min_corr
+            best_key = f"{KEY_NAMES[i]} minor"
+    return best_key
+
+
+class TestAnalyzeLocal:
+    """Tests for analyze_local."""
+
+    @pytest.mark.parametrize("bpm", [100, 120, 140])
+    def test_click_track_bpm(self, tmp_path, bpm):
+        """A steady click track is detected at its tempo."""
+        seconds = 8
+        y = librosa.clicks(times=np.arange(0, seconds, 60 / bpm), sr=SR, length=seconds * SR)
+
+        detected, _ = analyze_local(write_wav(tmp_path / "clicks.wav", y))
+
+        assert detected == pytest.approx(bpm, abs=2)
+
+    @pytest.mark.parametrize(
+        ("chords", "expected"),
+        [
+            # I-IV-V-I in C major
+            ([[60, 64, 67], [65, 69, 72], [67, 71, 74], [60, 64, 67]], "C major"),
+            # i-iv-V-i in A minor
+            ([[57, 60, 64], [62, 65, 69], [64, 68, 71], [57, 60, 64]], "A minor"),
+            # G major triad
+            ([[67, 71, 74]] * 3, "G major"),
+        ],
+    )
+    def test_chords_detect_key(self, tmp_path, chords, expected):
+        """Chord progressions and triads are detected in their key."""
+        _, key = analyze_local(write_wav(tmp_path / "chords.wav", chord_progression(chords)))
+
+        assert key == expected
+
+    def test_silence_is_skipped(self, tmp_path):
+        """Silent tracks get neither BPM nor key."""
+        path = write_wav(tmp_path / "silence.wav", np.zeros(3 * SR))
+
+        assert analyze_local(path) == (None, None)
+
+    def test_short_clip_is_skipped(self, tmp_path):
+        """Clips shorter than MIN_ANALYSIS_SECONDS get neither BPM nor key."""
+        y = chord_progression([[60, 64, 67]], seconds_per_chord=MIN_ANALYSIS_SECONDS / 2)
+        path = write_wav(tmp_path / "short.wav", y)
+
+        assert analyze_local(path) == (None, None)
+
+    def test_unreadable_file_returns_none(self, tmp_path):
+        """Files that fail to decode get neither BPM nor key."""
+        path = tmp_path / "broken.wav"
+        path.write_bytes(b"not audio")
+
+        assert analyze_local(path) == (None, None)
+
+
+class TestKeyProfiles:
+    """Tests for the precomputed key profile matrix."""
+
+    def test_profile_rows_are_centered_unit_vectors(self):
+        """Every (root, mode) row is zero-mean and unit-length."""
+        assert KEY_PROFILES.shape == (24, 12)
+        np.testing.assert_allclose(KEY_PROFILES.sum(axis=1), 0, atol=1e-12)
+        np.testing.assert_allclose(np.linalg.norm(KEY_PROFILES, axis=1), 1)
+
+    def test_argmax_matches_correlation_loop(self):
+        """argmax over KEY_PROFILES picks the same key as per-key np.corrcoef."""
+        rng = np.random.default_rng(0)
+        for _ in range(2000):
+            chroma_avg = rng.random(12) ** 3
+            root, mode = divmod(int(np.argmax(KEY_PROFILES @ chroma_avg)), 2)
+
+            assert f"{KEY_NAMES[root]} {KEY_MODES[mode]}" == correlation_loop_key(chroma_avg)
+
+
+def gemini_response(track_numbers):
+    """Schema-shaped Gemini reply naming every track."""
+    return json.dumps({
+        "patch": {
+            "suggested_name": "Test Patch",
+            "description": "Tracks for testing.",
+            "mood": ["calm"],
+            "musical_style": "ambient",
+            "energy_level": 3,
+            "tags": ["test"],
+        },
+        "tracks": [
+            {
+                "track_number": num,
+                "suggested_name": f"Layer {num}",
+                "role": "pad",
+                "instruments": ["synth"],
+                "description": "A layer.",
+                "energy_level": 3,
+            }
+            for num in track_numbers
+        ],
+    })
+
+
+class FakeGeminiClient:
+    """Stands in for genai.Client, recording uploads and deletes.
+
+    generate_content fails for any patch with an MP3 whose name contains
+    "fail", and uploading an MP3 whose name contains "broken" raises.
+    """
+
+    def __init__(self):
+        self.uploaded: list[str] = []
+        self.deleted: list[str] = []
+        self._lock = threading.Lock()
+        self.files = SimpleNamespace(upload=self._upload, delete=self._delete)
+        self.models = SimpleNamespace(generate_content=self._generate_content)
+
+    def _upload(self, file, config):
+        if "broken" in config.display_name:
+            raise ConnectionError("upload dropped")
+        with self._lock:
+            self.uploaded.append(config.display_name)
+        return SimpleNamespace(name=config.display_name, uri=config.display_name, mime_type="audio/mpeg")
+
+    def _delete(self, name):
+        with self._lock:
+            self.deleted.append(name)
+
+    def _generate_content(self, model, contents, config):
+        uris = [part.file_data.file_uri for c in contents for part in c.parts if part.file_data]
+        if any("fail" in uri for uri in uris):
+            raise RuntimeError("Gemini unavailable")
+        return SimpleNamespace(text=gemini_response(range(1, len(uris) + 1)), parsed=None)
+
+
+class InlineProcessPool(ThreadPoolExecutor):
+    """ProcessPoolExecutor stand-in so patched analyze_local is visible."""
+
+    def __init__(self, max_workers=None, mp_context=None, initializer=None):
+        super().__init__(max_workers=max_workers)
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """A temp catalog with analysis wired to fakes instead of librosa/Gemini."""
+    client = FakeGeminiClient()
+    cache_dir = tmp_path / "cache"
+    cleanup = ThreadPoolExecutor()
+    uploads: list[str] = []
+
+    def counting_upload(client, data, display_name):
+        uploads.append(display_name)
+        return gemini.upload_mp3(client, data, display_name)
+
+    monkeypatch.setattr(analyzer, "create_gemini_client", lambda: client)
+    monkeypatch.setattr(analyzer, "analyze_local", lambda path: (120.0, "A minor"))
+    monkeypatch.setattr(analyzer, "ProcessPoolExecutor", InlineProcessPool)
+    monkeypatch.setattr(analyzer, "upload_mp3", counting_upload)
+    monkeypatch.setattr(
+        analyzer, "load_cached_analysis", partial(gemini.load_cached_analysis, cache_dir=cache_dir)
+    )
+    monkeypatch.setattr(
+        analyzer,
+        "analyze_patch_with_gemini",
+        partial(gemini.analyze_patch_with_gemini, cache_dir=cache_dir),
+    )
+    monkeypatch.setattr(gemini, "_cleanup_executor", cleanup)
+
+    db = Database(tmp_path / "catalog.db")
+    output = io.StringIO()
+
+    def run():
+        analyzer.analyze_patches(db, Console(file=output, width=200))
+        cleanup.shutdown(wait=True)
+        return output.getvalue()
+
+    yield SimpleNamespace(
+        db=db, client=client, uploads=uploads, cache_dir=cache_dir, tmp_path=tmp_path, run=run
+    )
+    cleanup.shutdown(wait=True)
+
+
+def add_patch(pipeline, bank, mp3_names):
+    """Add a converted patch with one track per MP3 name, returning its catalog number."""
+    db = pipeline.db
+    patch = db.create_patch(original_bank=bank, source_path=f"/test/{bank}")
+    for num, name in enumerate(mp3_names, start=1):
+        mp3_path = pipeline.tmp_path / name
+        mp3_path.write_bytes(f"audio {bank} {num}".encode())
+        track = db.create_track(
+            patch_id=patch.id,
+            track_number=num,
+            filename=f"{bank:03d}_{num}.wav",
+            original_path=f"/original/{bank:03d}_{num}.wav",
+            wav_path=f"/managed/{bank:03d}_{num}.wav",
+            xxhash=f"full-{bank}-{num}",
+            quick_hash=f"quick-{bank}-{num}",
+            file_created_at=datetime.now(),
+            file_modified_at=datetime.now(),
+            duration_seconds=8.0,
+            sample_rate=44100,
+            channels=2,
+        )
+        db.update_track_mp3_path(track.id, str(mp3_path))
+    return patch.catalog_number
+
+
+class TestAnalyzePatches:
+    """Tests for analyze_patches with librosa and Gemini faked out."""
+
+    def test_patches_written_once_and_failures_counted(self, pipeline, monkeypatch):
+        """Every good patch is stored exactly once; a failing one is counted."""
+        good = [add_patch(pipeline, bank, [f"{bank}_1.mp3", f"{bank}_2.mp3"]) for bank in (1, 2, 3)]
+        bad = add_patch(pipeline, 4, ["4_1.mp3", "4_fail.mp3"])
+
+        writes: list[str] = []
+        update_patch_analysis = pipeline.db.update_patch_analysis
+
+        def counting_update(patch_id, analysis):
+            writes.append(patch_id)
+            update_patch_analysis(patch_id, analysis)
+
+        monkeypatch.setattr(pipeline.db, "update_patch_analysis", counting_update)
+
+        output = pipeline.run()
+
+        assert "Analyzed: 3 patch(es)" in output
+        assert "Errors: 1" in output
+        assert f"Error analyzing patch #{bad}" in output
+        assert sorted(writes) == sorted(pipeline.db.get_patch(n).id for n in good)
+        for number in good:
+            patch = pipeline.db.get_patch(number)
+            assert patch.analyzed_at is not None
+            assert patch.analysis.suggested_name == "Test Patch"
+            assert [t.bpm for t in patch.tracks] == [120.0, 120.0]
+            assert [t.analysis.suggested_name for t in patch.tracks] == ["Layer 1", "Layer 2"]
+
+    def test_cache_hit_skips_upload(self, pipeline):
+        """A patch whose audio was analyzed before is not uploaded again."""
+        number = add_patch(pipeline, 1, ["1_1.mp3", "1_2.mp3"])
+        tracks = pipeline.db.get_patch(number).tracks
+        mp3_data = [(t.track_number, (pipeline.tmp_path / t.mp3_path).read_bytes()) for t in tracks]
+        _store_cached_response(patch_content_hash(mp3_data), gemini_response([1, 2]), pipeline.cache_dir)
+
+        output = pipeline.run()
+
+        assert "Analyzed: 1 patch(es)" in output
+        assert pipeline.uploads == []
+        assert pipeline.db.get_patch(number).analysis.suggested_name == "Test Patch"
+
+    def test_gemini_failure_leaves_no_partial_rows(self, pipeline):
+        """Local results are not stored for a patch whose Gemini call fails."""
+        number = add_patch(pipeline, 1, ["1_1.mp3", "1_fail.mp3"])
+
+        output = pipeline.run()
+
+        assert "Errors: 1" in output
+        patch = pipeline.db.get_patch(number)
+        assert patch.analyzed_at is None
+        assert patch.analysis is None
+        assert [(t.bpm, t.detected_key, t.analysis) for t in patch.tracks] == [
+            (None, None, None),
+            (None, None, None),
+        ]
+
+    def test_uploads_deleted_when_gemini_fails(self, pipeline):
+        """Every successful upload is deleted even when generate_content raises."""
+        add_patch(pipeline, 1, ["1_1.mp3", "1_fail.mp3"])
+
+        pipeline.run()
+
+        assert sorted(pipeline.client.uploaded) == ["1_1.mp3", "1_fail.mp3"]
+        assert sorted(pipeline.client.deleted) == sorted(pipeline.client.uploaded)
+
+    def test_failed_upload_is_not_deleted(self, pipeline):
+        """A failed upload fails its patch but the other uploads are still deleted."""
+        add_patch(pipeline, 1, ["1_1.mp3", "1_broken.mp3", "1_3.mp3"])
+
+        output = pipeline.run()
+
+        assert "Errors: 1" in output
+        assert sorted(pipeline.client.uploaded) == ["1_1.mp3", "1_3.mp3"]
+        assert sorted(pipeline.client.deleted) == ["1_1.mp3", "1_3.mp3"]
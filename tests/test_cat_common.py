@@ -111,6 +111,43 @@ class TestThemePersistence:
             loaded = load_config(config_path)
             assert loaded == test_config
 
+    def test_load_config_picks_up_external_edits(self):
+        """load_config re-reads the file when its mtime changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            save_config({"theme": "nord"}, config_path)
+            assert load_config(config_path) == {"theme": "nord"}
+
+            config_path.write_text("theme: dracula\n")
+            stat = config_path.stat()
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            assert load_config(config_path) == {"theme": "dracula"}
+
+    def test_load_config_returns_independent_copies(self):
+        """Mutating a loaded config does not affect later loads."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            save_config({"theme": "nord"}, config_path)
+
+            config = load_config(config_path)
+            config["theme"] = "gruvbox"
+
+            assert load_config(config_path) == {"theme": "nord"}
+
+    def test_cached_config_does_not_share_nested_values(self):
+        """Nested values are not shared between callers and the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            saved = {"gridcat": {"octave": 4}}
+            save_config(saved, config_path)
+            saved["gridcat"]["octave"] = 5
+
+            config = load_config(config_path)
+            config["gridcat"]["octave"] = 6
+
+            assert load_config(config_path) == {"gridcat": {"octave": 4}}
+
 
 class TestThemesList:
     """Tests for the themes list."""
@@ -137,6 +174,14 @@ class TestThemesList:
         # Based on the current implementation
         assert len(BUILTIN_THEMES) >= 15
 
+    def test_filter_themes_matches_linear_scan(self):
+        """Indexed filter returns the same themes, in order, as a substring scan."""
+        from cat_common.themes import _filter_themes
+
+        for query in ["", "d", "dr", "dracula", "solar", "-light", "zzz"]:
+            expected = [t for t in THEMES if query in t.lower()]
+            assert _filter_themes(query) == expected, query
+
 
 class TestBase16Themes:
     """Tests for base16 themes."""
@@ -174,6 +219,14 @@ class TestThemePickerScreen:
         screen = ThemePickerScreen("dracula")
         assert screen.current_theme == "dracula"
 
+    def test_swatch_renders_theme_palette(self):
+        """Swatch markup uses the theme's colors; unknown themes render empty."""
+        from cat_common.themes import _render_swatch
+
+        theme = BASE16_THEMES[0]
+        assert theme.primary in _render_swatch(theme.name)
+        assert _render_swatch("no-such-theme") == ""
+
 
 class TestControlsFooter:
     """Tests for ControlsFooter widget."""
@@ -164,3 +164,37 @@ class TestDatabase:
 
         assert db.quick_hash_exists("quickhash123") is True
         assert db.quick_hash_exists("nonexistent") is False
+
+    def test_transaction_commits_together_or_rolls_back(self, db):
+        """Test that writes inside a transaction commit or roll back as one."""
+        patch = db.create_patch(original_bank=1, source_path="/test")
+        track = db.create_track(
+            patch_id=patch.id,
+            track_number=1,
+            filename="test.wav",
+            original_path="/original/test.wav",
+            wav_path="/managed/test.wav",
+            xxhash="fullhash",
+            quick_hash="quickhash",
+            file_created_at=datetime.now(),
+            file_modified_at=datetime.now(),
+            duration_seconds=10.0,
+            sample_rate=44100,
+            channels=2,
+        )
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.update_track_local_analysis(track.id, 120.0, "A minor")
+                raise RuntimeError("analysis failed")
+
+        assert db.get_patch(1).tracks[0].bpm is None
+
+        with db.transaction():
+            db.update_track_local_analysis(track.id, 120.0, "A minor")
+            db.update_track_mp3_path(track.id, "/managed/test.mp3")
+
+        saved = db.get_patch(1).tracks[0]
+        assert saved.bpm == 120.0
+        assert saved.detected_key == "A minor"
+        assert saved.mp3_path == "/managed/test.mp3"
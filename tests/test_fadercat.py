@@ -81,6 +81,33 @@ class TestMidiEngineCC:
             call_args = mock_port.send.call_args[0][0]
             assert call_args.channel == 10
 
+    def test_midi_engine_cc_batch_sends_each_pair(self):
+        """cc_batch() sends one control_change per pair, in order."""
+        from fadercat.midi import MidiEngine
+
+        with patch("fadercat.midi.mido.open_output") as mock_open:
+            mock_port = MagicMock()
+            mock_open.return_value = mock_port
+
+            engine = MidiEngine()
+            engine.connect("Test Port")
+
+            sent = []
+            mock_port.send.side_effect = lambda msg: sent.append((msg.control, msg.value))
+            engine.cc_batch([(1, 10), (2, 20), (3, 200)])
+            assert sent == [(1, 10), (2, 20), (3, 127)]
+
+    def test_midi_engine_open_virtual_uses_configured_name(self):
+        """open_virtual() defaults to the name given at construction."""
+        from fadercat.midi import MidiEngine
+
+        with patch("fadercat.midi.mido.open_output") as mock_open:
+            engine = MidiEngine(virtual_port_name="My Faders")
+            assert engine.open_virtual()
+            mock_open.assert_called_once_with("My Faders", virtual=True)
+            assert engine.port_name == "My Faders"
+            assert engine.is_virtual
+
 
 class TestFaderWidget:
     """Tests for FaderWidget."""
@@ -134,6 +161,26 @@ class TestFaderWidget:
         assert fader.selected is True
 
 
+    def test_fader_bar_fill_tracks_value(self):
+        """Bar lights a row count proportional to the value."""
+        from fadercat.tui import FaderWidget, BAR_ROW_EMPTY, BAR_ROW_FULL
+
+        fader = FaderWidget(
+            fader_index=0,
+            cc_number=1,
+            label="Mod",
+            key_up="Q",
+            key_down="A",
+        )
+        fader.value = 0
+        assert fader._render_bar().split("\n") == [BAR_ROW_EMPTY] * 10
+        fader.value = 127
+        assert fader._render_bar().split("\n") == [BAR_ROW_FULL] * 10
+        fader.value = 64
+        rows = fader._render_bar().split("\n")
+        assert rows == [BAR_ROW_EMPTY] * 5 + [BAR_ROW_FULL] * 5
+
+
 class TestFaderValueClamp:
     """Tests for fader value clamping."""
 
@@ -183,6 +230,24 @@ class TestDualKeyControl:
         # Bottom row A-K
         assert FADER_KEYS_DOWN == ["a", "s", "d", "f", "g", "h", "j", "k"]
 
+    def test_key_maps_apply_modifier_steps(self):
+        """Plain, shift (uppercase) and ctrl keys map to normal/fine/coarse steps."""
+        from fadercat.tui import (
+            KEY_MAPS, MODE_HORIZONTAL, MODE_VERTICAL,
+            STEP_COARSE, STEP_FINE, STEP_NORMAL,
+        )
+
+        vertical = KEY_MAPS[MODE_VERTICAL]
+        assert vertical["k"] == ("adjust", STEP_NORMAL)
+        assert vertical["K"] == ("adjust", STEP_FINE)
+        assert vertical["ctrl+j"] == ("adjust", -STEP_COARSE)
+        assert vertical["h"] == ("select", -1)
+        assert vertical["3"] == ("choose", 2)
+
+        horizontal = KEY_MAPS[MODE_HORIZONTAL]
+        assert horizontal["l"] == ("adjust", STEP_NORMAL)
+        assert horizontal["j"] == ("select", 1)
+
     @pytest.mark.asyncio
     async def test_k_increases_selected_fader(self):
         """K increases the selected fader (vertical mode)."""
@@ -237,6 +302,33 @@ class TestDualKeyControl:
                     assert faders[0].value < 64
 
 
+    @pytest.mark.asyncio
+    async def test_rapid_adjustments_send_one_cc(self):
+        """Adjustments within one frame are coalesced into a single CC."""
+        from fadercat.tui import FadercatApp, FaderScreen
+
+        mock_port = MagicMock()
+        with patch("fadercat.midi.mido.get_output_names", return_value=[]):
+            with patch("fadercat.midi.mido.open_output", return_value=mock_port):
+                app = FadercatApp()
+                async with app.run_test() as pilot:
+                    await pilot.pause()
+                    await pilot.pause()  # Extra pause for rebuild
+
+                    screen = app.screen
+                    assert isinstance(screen, FaderScreen)
+                    mock_port.send.reset_mock()
+
+                    for _ in range(3):
+                        screen._adjust_fader(0, 4)
+                    assert screen._get_active_faders()[0].value == 12
+
+                    await pilot.pause(0.1)
+
+                    sent = [c[0][0] for c in mock_port.send.call_args_list]
+                    assert [(m.control, m.value) for m in sent] == [(1, 12)]
+
+
 class TestFadercatApp:
     """Tests for FadercatApp."""
 
@@ -335,6 +427,89 @@ class TestFaderSelection:
 
                     assert faders[0].value == 0
 
+    @pytest.mark.asyncio
+    async def test_reset_at_zero_sends_nothing(self):
+        """Resetting a fader that is already at 0 sends no CC."""
+        from fadercat.tui import FadercatApp, FaderScreen
+
+        mock_port = MagicMock()
+        with patch("fadercat.midi.mido.get_output_names", return_value=[]):
+            with patch("fadercat.midi.mido.open_output", return_value=mock_port):
+                app = FadercatApp()
+                async with app.run_test() as pilot:
+                    await pilot.pause()
+                    await pilot.pause()  # Extra pause for rebuild
+
+                    screen = app.screen
+                    assert isinstance(screen, FaderScreen)
+                    screen.selected_fader = 0
+                    mock_port.send.reset_mock()
+
+                    await pilot.press("space")
+                    await pilot.pause(0.1)
+
+                    mock_port.send.assert_not_called()
+
+
+class TestPendingCCFlush:
+    """Pending CC values go out before the port or channel changes."""
+
+    @pytest.mark.asyncio
+    async def test_quit_flushes_pending_cc_before_disconnect(self):
+        """A value still waiting for the flush timer is sent on quit."""
+        from fadercat.tui import FadercatApp, FaderScreen
+
+        mock_port = MagicMock()
+        with patch("fadercat.midi.mido.get_output_names", return_value=[]):
+            with patch("fadercat.midi.mido.open_output", return_value=mock_port):
+                app = FadercatApp()
+                async with app.run_test() as pilot:
+                    await pilot.pause()
+                    await pilot.pause()  # Extra pause for rebuild
+
+                    screen = app.screen
+                    assert isinstance(screen, FaderScreen)
+                    mock_port.reset_mock()
+
+                    screen._adjust_fader(0, 5)
+                    app.action_quit()
+
+                    calls = [c[0] for c in mock_port.mock_calls if c[0] in ("send", "close")]
+                    assert calls == ["send", "close"]
+                    msg = mock_port.send.call_args[0][0]
+                    assert (msg.type, msg.value) == ("control_change", 5)
+                    assert screen._flush_timer is None
+
+    @pytest.mark.asyncio
+    async def test_channel_change_flushes_on_old_channel(self):
+        """Values queued before a channel change go out on the old channel."""
+        from fadercat.tui import ChannelPickerScreen, FadercatApp, FaderScreen
+
+        mock_port = MagicMock()
+        # Keep the flush timer from firing while the picker is open
+        with patch("fadercat.midi.mido.get_output_names", return_value=[]), patch("fadercat.tui.FLUSH_INTERVAL", 10.0):
+            with patch("fadercat.midi.mido.open_output", return_value=mock_port):
+                app = FadercatApp()
+                async with app.run_test() as pilot:
+                    await pilot.pause()
+                    await pilot.pause()  # Extra pause for rebuild
+
+                    screen = app.screen
+                    assert isinstance(screen, FaderScreen)
+                    mock_port.send.reset_mock()
+
+                    screen._adjust_fader(0, 5)
+                    screen.action_select_channel()
+                    await pilot.pause()
+                    assert isinstance(app.screen, ChannelPickerScreen)
+                    app.screen.dismiss(3)
+                    await pilot.pause(0.1)
+
+                    mock_port.send.assert_called_once()
+                    msg = mock_port.send.call_args[0][0]
+                    assert (msg.channel, msg.value) == (0, 5)
+                    assert app.midi.channel == 3
+
 
 class TestHelpScreen:
     """Tests for help screen."""
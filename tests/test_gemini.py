@@ -0,0 +1,207 @@
+"""Tests for Gemini analysis helpers."""
+
+import copy
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from loopcat.analyzer import gemini
+from loopcat.analyzer.gemini import (
+    _AnalysisResponse,
+    _parse_analysis,
+    _store_cached_response,
+    analyze_patch_with_gemini,
+    delete_upload_when_done,
+    load_cached_analysis,
+    patch_content_hash,
+)
+
+RESPONSE = {
+    "patch": {
+        "suggested_name": "Midnight Funk Groove",
+        "description": "Bass and drums lock in under a clean guitar.",
+        "mood": ["groovy"],
+        "musical_style": "funk",
+        "energy_level": 7,
+        "tags": ["guitar", "bass"],
+        "use_case": "practice backing track",
+    },
+    "tracks": [
+        {
+            "track_number": 1,
+            "suggested_name": "Funky Bass Line",
+            "role": "bass",
+            "instruments": ["bass guitar"],
+            "description": "Syncopated root notes.",
+            "energy_level": 6,
+        },
+        {
+            "track_number": 2,
+            "suggested_name": "Clean Chops",
+            "role": "rhythm",
+            "instruments": ["electric guitar"],
+            "description": "Muted sixteenth-note chords.",
+            "energy_level": 8,
+        },
+    ],
+}
+
+MP3_DATA = [(1, b"bass audio"), (2, b"guitar audio")]
+
+
+class TestPatchContentHash:
+    """Tests for patch_content_hash."""
+
+    def test_hash_is_stable(self):
+        """The same audio hashes the same way every time."""
+        assert patch_content_hash(MP3_DATA) == patch_content_hash(list(MP3_DATA))
+
+    def test_hash_ignores_track_order(self):
+        """Tracks are hashed in track order, not list order."""
+        assert patch_content_hash(MP3_DATA) == patch_content_hash(MP3_DATA[::-1])
+
+    def test_hash_changes_with_audio(self):
+        """Different audio, or the same audio on other tracks, hashes differently."""
+        assert patch_content_hash(MP3_DATA) != patch_content_hash([(1, b"bass audio"), (2, b"other")])
+        assert patch_content_hash(MP3_DATA) != patch_content_hash([(1, b"guitar audio"), (2, b"bass audio")])
+
+    def test_hash_changes_with_model_and_prompt(self, monkeypatch):
+        """Cached responses are not reused across models or prompt edits."""
+        original = patch_content_hash(MP3_DATA)
+
+        assert patch_content_hash(MP3_DATA, model_name="gemini-other") != original
+
+        monkeypatch.setattr(gemini, "ANALYSIS_PROMPT", gemini.ANALYSIS_PROMPT + "Be brief.\n")
+        assert patch_content_hash(MP3_DATA) != original
+
+
+class TestResponseCache:
+    """Tests for the on-disk Gemini response cache."""
+
+    def test_stored_response_loads_back(self, tmp_path):
+        """A stored response loads back as the same analyses."""
+        raw_response = json.dumps(RESPONSE)
+        _store_cached_response("abc123", raw_response, tmp_path)
+
+        cached = load_cached_analysis("abc123", tmp_path)
+
+        assert cached is not None
+        patch_analysis, track_analyses = cached
+        assert patch_analysis.raw_response == raw_response
+        assert patch_analysis.suggested_name == "Midnight Funk Groove"
+        assert patch_analysis.energy_level == 7
+        assert sorted(track_analyses) == [1, 2]
+        assert track_analyses[2].instruments == ["electric guitar"]
+
+    def test_store_leaves_no_temp_files(self, tmp_path):
+        """Only the final JSON file is left in the cache directory."""
+        _store_cached_response("abc123", json.dumps(RESPONSE), tmp_path)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["abc123.json"]
+
+    def test_missing_entry_returns_none(self, tmp_path):
+        """A hash with no cached response is a miss."""
+        assert load_cached_analysis("abc123", tmp_path) is None
+        assert load_cached_analysis("abc123", tmp_path / "missing") is None
+
+    @pytest.mark.parametrize("contents", ["", "{not json", "[]", '"just a string"'])
+    def test_corrupt_entry_returns_none(self, tmp_path, contents):
+        """An unreadable cache entry is treated as a miss."""
+        (tmp_path / "abc123.json").write_text(contents)
+
+        assert load_cached_analysis("abc123", tmp_path) is None
+
+
+class TestParseAnalysis:
+    """Tests for turning Gemini responses into analyses."""
+
+    def test_schema_response_parses(self):
+        """A response matching the schema maps onto the analysis models."""
+        patch_analysis, track_analyses = _parse_analysis(json.dumps(RESPONSE))
+
+        assert patch_analysis.musical_style == "funk"
+        assert patch_analysis.use_case == "practice backing track"
+        assert track_analyses[1].role == "bass"
+        assert track_analyses[2].energy_level == 8
+
+    def test_out_of_range_energy_is_clamped(self):
+        """Energy levels outside 1-10 are clamped instead of failing the patch."""
+        response = copy.deepcopy(RESPONSE)
+        response["patch"]["energy_level"] = 15
+        response["tracks"][0]["energy_level"] = 0
+
+        patch_analysis, track_analyses = _parse_analysis(json.dumps(response))
+
+        assert patch_analysis.energy_level == 10
+        assert track_analyses[1].energy_level == 1
+        assert track_analyses[2].energy_level == 8
+
+    def test_out_of_range_energy_from_gemini_is_clamped(self):
+        """A parsed response that fails validation falls back to the lenient parse."""
+        response = copy.deepcopy(RESPONSE)
+        response["patch"]["energy_level"] = 11
+        raw_response = json.dumps(response)
+        # As if the SDK handed back an object that skipped the range check
+        parsed = _AnalysisResponse.model_validate(RESPONSE)
+        parsed.patch.energy_level = 11
+        client = SimpleNamespace(
+            models=SimpleNamespace(
+                generate_content=lambda **kwargs: SimpleNamespace(text=raw_response, parsed=parsed)
+            )
+        )
+
+        patch_analysis, _ = analyze_patch_with_gemini(client, [])
+
+        assert patch_analysis.energy_level == 10
+
+    def test_missing_fields_get_defaults(self):
+        """Fields the response leaves out fall back to defaults."""
+        patch_analysis, track_analyses = _parse_analysis(
+            '{"patch": {"suggested_name": "Sketch"}, "tracks": [{"track_number": 3}]}'
+        )
+
+        assert patch_analysis.suggested_name == "Sketch"
+        assert patch_analysis.energy_level == 5
+        assert track_analyses[3].suggested_name == "Track 3"
+
+
+class TestDeleteUploadWhenDone:
+    """Tests for background deletion of uploaded files."""
+
+    @pytest.fixture
+    def cleanup(self, monkeypatch):
+        """Swap in a private cleanup pool so tests can wait for deletes."""
+        executor = ThreadPoolExecutor()
+        monkeypatch.setattr(gemini, "_cleanup_executor", executor)
+        yield executor
+        executor.shutdown(wait=True)
+
+    @pytest.fixture
+    def client(self):
+        deleted = []
+        return SimpleNamespace(deleted=deleted, files=SimpleNamespace(delete=lambda name: deleted.append(name)))
+
+    def test_successful_upload_is_deleted(self, cleanup, client):
+        """A finished upload is deleted, even if it finished after registration."""
+        future = Future()
+        delete_upload_when_done(client, future)
+        future.set_result(SimpleNamespace(name="files/bass"))
+
+        cleanup.shutdown(wait=True)
+
+        assert client.deleted == ["files/bass"]
+
+    def test_failed_upload_is_skipped(self, cleanup, client):
+        """Failed and cancelled uploads have nothing to delete."""
+        failed = Future()
+        failed.set_exception(ConnectionError("upload dropped"))
+        cancelled = Future()
+        cancelled.cancel()
+
+        delete_upload_when_done(client, failed)
+        delete_upload_when_done(client, cancelled)
+        cleanup.shutdown(wait=True)
+
+        assert client.deleted == []
@@ -182,6 +182,17 @@ class TestMidiEngine:
             assert engine.is_virtual is False
             assert engine.port_name == ""
 
+    def test_midi_engine_open_virtual_uses_configured_name(self):
+        """open_virtual() defaults to the name given at construction."""
+        from gridcat.midi import MidiEngine
+
+        with patch("gridcat.midi.mido.open_output") as mock_open:
+            engine = MidiEngine(virtual_port_name="My Grid")
+            assert engine.open_virtual()
+            mock_open.assert_called_once_with("My Grid", virtual=True)
+            assert engine.port_name == "My Grid"
+            assert engine.is_virtual
+
 
 class TestPadWidget:
     """Tests for PadWidget."""
@@ -208,6 +219,19 @@ class TestPadWidget:
         assert "Q" in content
         assert "C4" in content
 
+    def test_pad_widget_render_cached_until_invalidated(self):
+        """PadWidget reuses its markup until invalidate_render() is called."""
+        from gridcat.tui import PadWidget, PadConfig
+
+        pad = PadWidget("Q", PadConfig(note=60), row=0, col=0)
+        assert "C4" in pad.render()
+
+        pad.config.note = 72
+        assert "C4" in pad.render()
+
+        pad.invalidate_render()
+        assert "C5" in pad.render()
+
     def test_pad_widget_pressed_state(self):
         """PadWidget tracks pressed state."""
         from gridcat.tui import PadWidget, PadConfig
@@ -254,6 +278,16 @@ class TestGridKeyMapping:
         assert note_to_name(48) == "C3"
         assert note_to_name(61) == "C#4"
 
+    def test_note_name_table_covers_midi_range(self):
+        """NOTE_NAME_TABLE agrees with note_to_name across all MIDI notes."""
+        from gridcat.tui import NOTE_NAME_TABLE, note_to_name
+
+        assert len(NOTE_NAME_TABLE) == 128
+        assert NOTE_NAME_TABLE[0] == "C-1"
+        assert NOTE_NAME_TABLE[127] == "G9"
+        assert all(note_to_name(n) == NOTE_NAME_TABLE[n] for n in range(128))
+        assert note_to_name(132) == "C10"  # Out-of-range notes still format
+
     def test_key_rows_structure(self):
         """KEY_ROWS has correct structure."""
         from gridcat.tui import KEY_ROWS
@@ -278,6 +312,26 @@ class TestGridKeyMapping:
         # Row 3: Z-,
         assert KEY_ROWS[3] == ["z", "x", "c", "v", "b", "n", "m", "comma"]
 
+    def test_key_to_pos_matches_key_rows(self):
+        """KEY_TO_POS locates every grid key at its row and column."""
+        from gridcat.tui import KEY_ROWS, KEY_TO_POS
+
+        assert len(KEY_TO_POS) == 32
+        for key, (row, col) in KEY_TO_POS.items():
+            assert KEY_ROWS[row][col] == key
+
+    def test_key_events_resolve_modifiers(self):
+        """Key event names resolve to base key and shift; ctrl is ignored."""
+        from gridcat.tui import GRID_KEY_EVENTS, PIANO_KEY_EVENTS
+
+        assert GRID_KEY_EVENTS["q"] == ("q", False)
+        assert GRID_KEY_EVENTS["shift+q"] == ("q", True)
+        assert GRID_KEY_EVENTS[","] == ("comma", False)
+        assert GRID_KEY_EVENTS["shift+,"] == ("comma", True)
+        assert "ctrl+q" not in GRID_KEY_EVENTS
+        assert PIANO_KEY_EVENTS["shift+p"] == ("p", True)
+        assert "p" not in GRID_KEY_EVENTS
+
 
 class TestGridcatApp:
     """Tests for GridcatApp."""
@@ -326,6 +380,102 @@ class TestGridcatApp:
                         assert len(list(pads)) == 32
 
 
+class TestGridSelection:
+    """Tests for pad selection."""
+
+    @pytest.mark.asyncio
+    async def test_first_selection_updates_once(self):
+        """Setting row and col together refreshes the selection once."""
+        from gridcat.tui import GridcatApp, GridScreen
+        from gridcat.settings import GridcatSettings
+
+        mock_settings = GridcatSettings(view="grid")
+        with patch("gridcat.tui.get_settings", return_value=mock_settings):
+            with patch("gridcat.midi.mido.get_output_names", return_value=[]):
+                with patch("gridcat.midi.mido.open_output"):
+                    app = GridcatApp()
+                    async with app.run_test() as pilot:
+                        await pilot.pause()
+
+                        screen = app.screen
+                        assert isinstance(screen, GridScreen)
+
+                        with patch.object(
+                            screen, "_update_selection", wraps=screen._update_selection
+                        ) as update:
+                            await pilot.press("ctrl+l")
+                            await pilot.pause()
+
+                            assert update.call_count == 1
+
+                        selected = [
+                            (pad.row, pad.col)
+                            for row in screen._pad_grid
+                            for pad in row
+                            if pad.selected
+                        ]
+                        assert selected == [(0, 0)]
+
+    @pytest.mark.asyncio
+    async def test_navigation_keeps_single_selected_pad(self):
+        """Moving and clearing the selection leaves at most one pad selected."""
+        from gridcat.tui import GridcatApp, GridScreen
+        from gridcat.settings import GridcatSettings
+
+        mock_settings = GridcatSettings(view="grid")
+        with patch("gridcat.tui.get_settings", return_value=mock_settings):
+            with patch("gridcat.midi.mido.get_output_names", return_value=[]):
+                with patch("gridcat.midi.mido.open_output"):
+                    app = GridcatApp()
+                    async with app.run_test() as pilot:
+                        await pilot.pause()
+
+                        screen = app.screen
+                        assert isinstance(screen, GridScreen)
+
+                        def selected():
+                            return [
+                                (pad.row, pad.col)
+                                for row in screen._pad_grid
+                                for pad in row
+                                if pad.selected
+                            ]
+
+                        for key in ("ctrl+l", "ctrl+l", "ctrl+j", "ctrl+h"):
+                            await pilot.press(key)
+                        await pilot.pause()
+                        assert selected() == [(1, 0)]
+
+                        await pilot.press("escape")
+                        await pilot.pause()
+                        assert selected() == []
+
+    @pytest.mark.asyncio
+    async def test_unchanged_status_is_not_rerendered(self):
+        """_update_status skips the status bar when its text is unchanged."""
+        from gridcat.tui import GridcatApp, GridScreen, StatusBar
+        from gridcat.settings import GridcatSettings
+
+        mock_settings = GridcatSettings(view="grid")
+        with patch("gridcat.tui.get_settings", return_value=mock_settings):
+            with patch("gridcat.midi.mido.get_output_names", return_value=[]):
+                with patch("gridcat.midi.mido.open_output"):
+                    app = GridcatApp()
+                    async with app.run_test() as pilot:
+                        await pilot.pause()
+
+                        screen = app.screen
+                        assert isinstance(screen, GridScreen)
+                        status = screen.query_one(StatusBar)
+
+                        with patch.object(status, "update") as update:
+                            screen._update_status()
+                            update.assert_not_called()
+
+                            screen.midi_channel = 5
+                            update.assert_called_once()
+
+
 class TestOctaveShift:
     """Tests for octave shifting."""
 
@@ -403,6 +553,98 @@ class TestOctaveShift:
                         # Note should increase by 12 (one octave)
                         assert pads[0].config.note == initial_note + 12
 
+    @pytest.mark.asyncio
+    async def test_octave_shift_skips_non_note_pads(self):
+        """Octave shift re-renders note pads and leaves CC pads alone."""
+        from gridcat.tui import GridcatApp, PadConfig, PadWidget
+        from gridcat.settings import GridcatSettings
+
+        mock_settings = GridcatSettings(view="grid")
+        with patch("gridcat.tui.get_settings", return_value=mock_settings):
+            with patch("gridcat.midi.mido.get_output_names", return_value=[]):
+                with patch("gridcat.midi.mido.open_output"):
+                    app = GridcatApp()
+                    async with app.run_test() as pilot:
+                        await pilot.pause()
+
+                        screen = app.screen
+                        pads = list(screen.query(PadWidget))
+                        pads[1].config = PadConfig(msg_type="cc", cc_number=7)
+                        pads[1].invalidate_render()
+                        note_before = pads[0].render()
+
+                        with patch.object(pads[1], "invalidate_render") as cc_invalidate:
+                            await pilot.press("up")
+                            await pilot.pause()
+
+                        cc_invalidate.assert_not_called()
+                        assert "CC7" in pads[1].render()
+                        assert pads[0].render() != note_before
+
+
+class TestGridcatSettings:
+    """Tests for settings persistence."""
+
+    def test_settings_round_trip_keeps_other_config(self):
+        """save() writes every field and leaves other config keys alone."""
+        import os
+        import tempfile
+
+        from cat_common import get_config_path, load_config, save_config
+        from gridcat.settings import GridcatSettings
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {"XDG_CONFIG_HOME": tmpdir}):
+                save_config({"theme": "nord"}, get_config_path("gridcat"))
+                settings = GridcatSettings(
+                    view="keyboard",
+                    play_mode="trigger",
+                    hold_initial_delay_ms=250,
+                    hold_repeat_delay_ms=90,
+                    trigger_duration_ms=40,
+                )
+                settings.save()
+
+                assert GridcatSettings.load() == settings
+                assert load_config(get_config_path("gridcat"))["theme"] == "nord"
+
+
+class TestTriggerMode:
+    """Tests for trigger play mode."""
+
+    @pytest.mark.asyncio
+    async def test_trigger_releases_share_one_timer(self):
+        """Rapid triggers release every note through one pending timer."""
+        from gridcat.tui import GridcatApp, GridScreen
+        from gridcat.settings import GridcatSettings
+
+        mock_settings = GridcatSettings(
+            view="grid", play_mode="trigger", trigger_duration_ms=300
+        )
+        with patch("gridcat.tui.get_settings", return_value=mock_settings):
+            with patch("gridcat.midi.mido.get_output_names", return_value=[]):
+                with patch("gridcat.midi.mido.open_output"):
+                    app = GridcatApp()
+                    async with app.run_test() as pilot:
+                        await pilot.pause()
+
+                        screen = app.screen
+                        assert isinstance(screen, GridScreen)
+
+                        with patch.object(screen.midi, "note_off") as note_off:
+                            await pilot.press("q", "w", "e")
+                            pads = screen._pad_grid[1][:3]  # Q, W, E
+                            assert all(pad.pressed for pad in pads)
+                            timer = screen._trigger_releases._timer
+                            assert timer is not None
+
+                            await pilot.pause(0.6)
+
+                            assert note_off.call_count == 3
+                            assert not any(pad.pressed for pad in pads)
+                            assert screen._held_keys == {}
+                            assert screen._trigger_releases._timer is None
+
 
 class TestHelpScreen:
     """Tests for help screen."""
@@ -517,3 +759,84 @@ class TestCommandPalette:
 
                         option_list = palette.query_one("#palette-list", OptionList)
                         assert option_list.option_count == len(COMMANDS_GRID)
+
+    @pytest.mark.asyncio
+    async def test_command_palette_filters_as_you_type(self):
+        """Typing narrows the palette and clearing the filter restores it."""
+        from gridcat.tui import GridcatApp, CommandPalette, COMMANDS_GRID
+        from gridcat.settings import GridcatSettings
+        from textual.widgets import OptionList
+
+        mock_settings = GridcatSettings(view="grid")
+        with patch("gridcat.tui.get_settings", return_value=mock_settings):
+            with patch("gridcat.midi.mido.get_output_names", return_value=[]):
+                with patch("gridcat.midi.mido.open_output"):
+                    app = GridcatApp()
+                    async with app.run_test() as pilot:
+                        await pilot.pause()
+
+                        await pilot.press("colon")
+                        await pilot.pause()
+
+                        palette = app.screen
+                        assert isinstance(palette, CommandPalette)
+                        option_list = palette.query_one("#palette-list", OptionList)
+
+                        await pilot.press("t", "h")
+                        await pilot.pause()
+                        assert [
+                            option_list.get_option_at_index(i).id
+                            for i in range(option_list.option_count)
+                        ] == ["theme"]
+
+                        await pilot.press("z")
+                        await pilot.pause()
+                        assert option_list.option_count == 0
+
+                        for _ in range(3):
+                            await pilot.press("backspace")
+                        await pilot.pause()
+                        assert option_list.option_count == len(COMMANDS_GRID)
+
+
+class TestPadEditor:
+    """Tests for the pad editor."""
+
+    @pytest.mark.asyncio
+    async def test_pad_editor_switches_fields_and_saves(self):
+        """Changing the type toggles its fields and save applies the config."""
+        from gridcat.tui import GridcatApp, GridScreen, PadEditorScreen
+        from gridcat.settings import GridcatSettings
+
+        mock_settings = GridcatSettings(view="grid")
+        with patch("gridcat.tui.get_settings", return_value=mock_settings):
+            with patch("gridcat.midi.mido.get_output_names", return_value=[]):
+                with patch("gridcat.midi.mido.open_output"):
+                    app = GridcatApp()
+                    async with app.run_test() as pilot:
+                        await pilot.pause()
+
+                        screen = app.screen
+                        assert isinstance(screen, GridScreen)
+                        pad = screen._pad_grid[0][0]
+                        screen._open_pad_editor(pad)
+                        await pilot.pause()
+
+                        editor = app.screen
+                        assert isinstance(editor, PadEditorScreen)
+                        assert editor.query_one("#note-row").display
+                        assert not editor.query_one("#cc-num-row").display
+
+                        editor.query_one("#msg-type").value = "cc"
+                        await pilot.pause()
+                        assert not editor.query_one("#note-row").display
+                        assert editor.query_one("#cc-num-row").display
+
+                        editor.query_one("#cc-num-input").value = "74"
+                        editor.action_save()
+                        await pilot.pause()
+
+                        assert app.screen is screen
+                        assert pad.config.msg_type == "cc"
+                        assert pad.config.cc_number == 74
+                        assert "CC74" in pad.render()